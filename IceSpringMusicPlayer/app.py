@@ -16,6 +16,7 @@ if typing.TYPE_CHECKING:
     from IceSpringMusicPlayer.services.pluginService import PluginService
     from IceSpringMusicPlayer.services.configService import ConfigService
     from IceSpringMusicPlayer.services.playlistService import PlaylistService
+    from IceSpringMusicPlayer.services.folderWatchService import FolderWatchService
     from IceSpringMusicPlayer.windows.mainWindow import MainWindow
 
 
@@ -40,6 +41,7 @@ class App(QtWidgets.QApplication):
         from IceSpringMusicPlayer.services.configService import ConfigService
         from IceSpringMusicPlayer.services.pluginService import PluginService
         from IceSpringMusicPlayer.services.playlistService import PlaylistService
+        from IceSpringMusicPlayer.services.folderWatchService import FolderWatchService
         super().__init__()
         self._logger = logging.getLogger("app")
         self._pluginService = PluginService(self)
@@ -49,6 +51,7 @@ class App(QtWidgets.QApplication):
         self._player = Player(self)
         self._player.setVolume(self._config.volume)
         self._playlistService = PlaylistService(self)
+        self._folderWatchService = FolderWatchService(self)
         self._zoom = self._config.applicationFont.pointSize() / self.font().pointSize()
         self.setFont(self._config.applicationFont)
         self.setApplicationName("Ice Spring Music Player")
@@ -66,6 +69,9 @@ class App(QtWidgets.QApplication):
     def getPlaylistService(self) -> PlaylistService:
         return self._playlistService
 
+    def getFolderWatchService(self) -> FolderWatchService:
+        return self._folderWatchService
+
     def _setupLanguage(self, language: str):
         self._logger.info("Setup language: %s", language)
         for module in {tt, *{x.getPluginTranslationModule() for x in self._pluginService.getPluginClasses()}}:
@@ -0,0 +1,38 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 11:02
+
+import subprocess
+import threading
+import typing
+
+
+class DecodeJob(object):
+    def __init__(self, generation: int):
+        self._generation = generation
+        self._cancelled = False
+        self._callbacks: typing.List[typing.Callable[[], typing.Any]] = []
+        self._lock = threading.Lock()
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def isCancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def onCancel(self, callback: typing.Callable[[], typing.Any]) -> None:
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def attachProcess(self, process: subprocess.Popen) -> None:
+        self.onCancel(lambda: process.poll() is None and process.kill())
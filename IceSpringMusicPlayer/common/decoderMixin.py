@@ -0,0 +1,22 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 13:05
+
+import typing
+
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
+
+
+class DecoderMixin(object):
+    @classmethod
+    def getDecoderName(cls) -> str:
+        return cls.__name__
+
+    @classmethod
+    def isDecoderAvailable(cls) -> bool:
+        return True
+
+    def isFileSupported(self, filename: str, sampleRate: int) -> bool:
+        return True
+
+    def decodeBlocks(self, job: DecodeJob, filename: str, sampleRate: int, blockSize: int,
+            startMillis: int = 0) -> typing.Iterator[memoryview]:
+        raise NotImplementedError
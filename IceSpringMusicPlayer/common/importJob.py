@@ -0,0 +1,47 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 21:10
+
+import threading
+import typing
+
+from IceSpringMusicPlayer.domains.music import Music
+from IceSpringMusicPlayer.domains.playlist import Playlist
+
+
+class ImportJob(object):
+    def __init__(self, source: str):
+        self._source = source
+        self._cancelled = threading.Event()
+        self._progress = 0
+        self._total = 0
+        self._playlist: typing.Optional[Playlist] = None
+        self._musics: typing.List[Music] = []
+
+    def getPlaylist(self) -> typing.Optional[Playlist]:
+        return self._playlist
+
+    def setPlaylist(self, playlist: Playlist) -> None:
+        self._playlist = playlist
+
+    def getMusics(self) -> typing.List[Music]:
+        return self._musics
+
+    def addMusics(self, musics: typing.List[Music]) -> None:
+        self._musics.extend(musics)
+
+    def getSource(self) -> str:
+        return self._source
+
+    def getProgress(self) -> int:
+        return self._progress
+
+    def getTotal(self) -> int:
+        return self._total
+
+    def setProgress(self, progress: int, total: int) -> None:
+        self._progress, self._total = progress, total
+
+    def isCancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
@@ -0,0 +1,45 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 10:20
+
+import array
+import mmap
+import typing
+
+
+class MappedSamples(object):
+    def __init__(self, filename: str, typecode: str):
+        self._typecode = typecode
+        with open(filename, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap).cast(typecode)
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, item: slice) -> array.array:
+        assert isinstance(item, slice) and item.step is None
+        samples = array.array(self._typecode)
+        samples.frombytes(self._view[item].cast("B"))
+        return samples
+
+    def getView(self, start: int, stop: int) -> memoryview:
+        return self._view[start:stop]
+
+    def copyInto(self, start: int, target: array.array) -> int:
+        if not 0 <= start < len(self._view):
+            return 0
+        count = min(len(target), len(self._view) - start)
+        memoryview(target)[:count] = self._view[start:start + count]
+        return count
+
+    def getRange(self) -> typing.Tuple[int, int]:
+        return 0, len(self._view)
+
+    def isClosed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        self._closed = True
+
+    def setPlayhead(self, index: int) -> None:
+        pass
@@ -1,26 +1,38 @@
 # Created by BaiJiFeiLong@gmail.com at 2022/2/22 15:14
 import logging
+import typing
 
 import taglib
 from IceSpringPathLib import Path
 from PySide2 import QtMultimedia, QtCore
 
+from IceSpringMusicPlayer.common.seekTable import SeekTable
+from IceSpringMusicPlayer.utils.mp3Utils import Mp3Utils
+
 
 class PatchedMediaPlayer(QtMultimedia.QMediaPlayer):
     durationChanged: QtCore.SignalInstance = QtCore.Signal(int)
     positionChanged: QtCore.SignalInstance = QtCore.Signal(int)
 
+    _durationTolerance = 0.02
+
     def __init__(self):
         super().__init__()
         self._logger = logging.getLogger("patchedMediaPlayer")
         self._realDuration = 0
         self._lastFakePosition = 0
+        self._lastRealPosition = 0
         self._bugRate = 0.0
+        self._superDuration = 0
+        self._seekTable: typing.Optional[SeekTable] = None
+        self._byteMapping = False
         super().durationChanged.connect(self._onSuperDurationChanged)
         super().positionChanged.connect(self._onSuperPositionChanged)
 
     def _onSuperDurationChanged(self, duration: int):
+        self._superDuration = duration
         self._bugRate = duration / self._realDuration
+        self._refreshByteMapping()
         self.durationChanged.emit(self._realDuration)
 
     def _onSuperPositionChanged(self):
@@ -28,33 +40,70 @@ class PatchedMediaPlayer(QtMultimedia.QMediaPlayer):
             super().position(), super().duration(), self.position(), self.duration())
         self.positionChanged.emit(self.position())
 
-    def setMedia(self, media: QtMultimedia.QMediaContent, stream: QtCore.QIODevice = None, realDuration=None) -> None:
+    def setMedia(self, media: QtMultimedia.QMediaContent, stream: QtCore.QIODevice = None, realDuration=None,
+            seekTable: SeekTable = None) -> None:
         self.blockSignals(True)
         super().setMedia(media, stream)
         self.blockSignals(False)
         self._realDuration = realDuration
         self._lastFakePosition = 0
+        self._lastRealPosition = 0
         self._bugRate = 0.0
-        if realDuration is None:
+        self._superDuration = 0
+        self._seekTable = seekTable
+        self._byteMapping = False
+        if seekTable is not None:
+            self._realDuration = seekTable.getDuration()
+        elif realDuration is None:
             filename = media.canonicalUrl().toLocalFile()
-            file = taglib.File(filename)
-            bitrate = file.bitrate
-            file.close()
-            self._realDuration = Path(filename).stat().st_size * 8 // bitrate
+            self._realDuration = Mp3Utils.calcDuration(filename) if filename.lower().endswith(".mp3") else None
+            if self._realDuration is None:
+                file = taglib.File(filename)
+                bitrate = file.bitrate
+                file.close()
+                self._realDuration = Path(filename).stat().st_size * 8 // bitrate
+
+    def setSeekTable(self, seekTable: SeekTable) -> None:
+        self._logger.info("Set seek table, duration: %d => %d", self._realDuration, seekTable.getDuration())
+        position = self.position()
+        self._seekTable = seekTable
+        self._lastFakePosition = super().position()
+        self._lastRealPosition = position
+        if seekTable.getDuration() != self._realDuration:
+            self._realDuration = seekTable.getDuration()
+            self._bugRate = 0.0 if self._superDuration == 0 else self._superDuration / self._realDuration
+            self.durationChanged.emit(self._realDuration)
+        self._refreshByteMapping()
+
+    def _refreshByteMapping(self) -> None:
+        if self._seekTable is None or self._superDuration == 0:
+            self._byteMapping = False
+            return
+        realDuration = max(self._seekTable.getDuration(), 1)
+        self._byteMapping = abs(self._superDuration - realDuration) / realDuration > self._durationTolerance
+        self._logger.info("Backend duration %d vs real duration %d, byte mapping: %s",
+            self._superDuration, realDuration, self._byteMapping)
+
+    def _calcFakePosition(self, position: int) -> int:
+        if not self._byteMapping:
+            return int(position * self._bugRate)
+        audioStart, audioEnd = self._seekTable.getAudioStart(), self._seekTable.getAudioEnd()
+        ratio = (self._seekTable.findOffset(position) - audioStart) / max(audioEnd - audioStart, 1)
+        return int(ratio * self._superDuration)
 
     def setPosition(self, position: int) -> None:
         assert self._bugRate != 0 or position == 0
-        fakePosition = int(position * self._bugRate)
-        super().setPosition(int(position * self._bugRate))
+        fakePosition = self._calcFakePosition(position)
+        super().setPosition(fakePosition)
         self._lastFakePosition = fakePosition
+        self._lastRealPosition = position
 
     def duration(self) -> int:
         return self._realDuration
 
     def position(self) -> int:
         elapsed = super().position() - self._lastFakePosition
-        lastPosition = 0 if self._lastFakePosition == 0 else int(self._lastFakePosition / self._bugRate)
-        realPosition = lastPosition + elapsed
+        realPosition = self._lastRealPosition + elapsed
         realPosition = max(realPosition, 0)
         realPosition = min(realPosition, self._realDuration)
         return realPosition
@@ -0,0 +1,97 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 9:12
+
+import array
+import threading
+import typing
+
+
+class SampleRingBuffer(object):
+    def __init__(self, typecode: str, behindCount: int, aheadCount: int, jumpCount: int = 0):
+        self._typecode = typecode
+        self._behindCount = behindCount
+        self._aheadCount = aheadCount
+        self._jumpCount = jumpCount
+        self._capacity = behindCount + aheadCount
+        self._samples = array.array(typecode, bytes(array.array(typecode).itemsize * self._capacity))
+        self._view = memoryview(self._samples)
+        self._start = 0
+        self._end = 0
+        self._playhead = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return self._end
+
+    def __getitem__(self, item: slice) -> array.array:
+        assert isinstance(item, slice) and item.step is None
+        with self._condition:
+            start = max(self._start, 0 if item.start is None else item.start)
+            stop = min(self._end, self._end if item.stop is None else item.stop)
+            if start >= stop:
+                return array.array(self._typecode)
+            head, tail = start % self._capacity, stop % self._capacity
+            if head < tail:
+                return self._samples[head:tail]
+            return self._samples[head:] + self._samples[:tail]
+
+    def copyInto(self, start: int, target: array.array) -> int:
+        with self._condition:
+            if not self._start <= start < self._end:
+                return 0
+            count = min(len(target), self._end - start)
+            head = start % self._capacity
+            first = min(count, self._capacity - head)
+            targetView = memoryview(target)
+            targetView[:first] = self._view[head:head + first]
+            targetView[first:count] = self._view[:count - first]
+            return count
+
+    def getRange(self) -> typing.Tuple[int, int]:
+        return self._start, self._end
+
+    def isClosed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reset(self, index: int) -> None:
+        with self._condition:
+            self._start = self._end = index
+            self._condition.notify_all()
+
+    def setPlayhead(self, index: int) -> None:
+        with self._condition:
+            self._playhead = index
+            self._condition.notify_all()
+
+    def getPlayhead(self) -> int:
+        return self._playhead
+
+    def isPlayheadOutside(self) -> bool:
+        return self._playhead < self._start or 0 < self._jumpCount < self._playhead - self._end
+
+    def waitPlayheadOutside(self) -> bool:
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or self.isPlayheadOutside())
+            return not self._closed
+
+    def write(self, samples: memoryview) -> bool:
+        offset = 0
+        while offset < len(samples):
+            with self._condition:
+                self._condition.wait_for(lambda: self._closed or self.isPlayheadOutside()
+                    or self._end - self._playhead < self._aheadCount)
+                if self._closed or self.isPlayheadOutside():
+                    return False
+                count = min(len(samples) - offset, self._capacity - self._end % self._capacity,
+                    self._aheadCount - (self._end - self._playhead))
+                head = self._end % self._capacity
+                self._view[head:head + count] = samples[offset:offset + count]
+                self._end += count
+                self._start = max(self._start, self._end - self._capacity)
+                offset += count
+        return True
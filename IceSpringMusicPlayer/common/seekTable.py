@@ -0,0 +1,55 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 14:30
+
+from __future__ import annotations
+
+import array
+import bisect
+
+
+class SeekTable(object):
+    def __init__(self, intervalMillis: int, duration: int, audioStart: int, audioEnd: int, offsets: array.array):
+        assert len(offsets) > 0
+        self._intervalMillis = intervalMillis
+        self._duration = duration
+        self._audioStart = audioStart
+        self._audioEnd = audioEnd
+        self._offsets = offsets
+
+    def getDuration(self) -> int:
+        return self._duration
+
+    def getAudioStart(self) -> int:
+        return self._audioStart
+
+    def getAudioEnd(self) -> int:
+        return self._audioEnd
+
+    def findOffset(self, millis: int) -> int:
+        millis = min(max(millis, 0), self._duration)
+        index = min(millis // self._intervalMillis, len(self._offsets) - 1)
+        left, right = self._offsets[index], self._calcNextOffset(index)
+        rightMillis = min((index + 1) * self._intervalMillis, self._duration)
+        leftMillis = index * self._intervalMillis
+        ratio = 0 if rightMillis <= leftMillis else (millis - leftMillis) / (rightMillis - leftMillis)
+        return left + int((right - left) * ratio)
+
+    def findMillis(self, offset: int) -> int:
+        index = max(bisect.bisect_right(self._offsets, offset) - 1, 0)
+        left, right = self._offsets[index], self._calcNextOffset(index)
+        rightMillis = min((index + 1) * self._intervalMillis, self._duration)
+        leftMillis = index * self._intervalMillis
+        ratio = 0 if right <= left else min(max((offset - left) / (right - left), 0), 1)
+        return leftMillis + int((rightMillis - leftMillis) * ratio)
+
+    def _calcNextOffset(self, index: int) -> int:
+        return self._offsets[index + 1] if index + 1 < len(self._offsets) else self._audioEnd
+
+    def toBytes(self) -> bytes:
+        header = array.array("q", [self._intervalMillis, self._duration, self._audioStart, self._audioEnd])
+        return header.tobytes() + self._offsets.tobytes()
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> SeekTable:
+        values = array.array("q")
+        values.frombytes(data)
+        return cls(values[0], values[1], values[2], values[3], values[4:])
@@ -12,6 +12,7 @@ class Playlist(object):
     name: str
     musics: Vector[Music]
     selectedIndexes: typing.Set[int]
+    watchedFolder: str = ""
 
     def __repr__(self):
         return "<Playlist:name={},size={}>".format(self.name, len(self.musics))
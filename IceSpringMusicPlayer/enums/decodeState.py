@@ -0,0 +1,24 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 15:20
+
+from __future__ import annotations
+
+import enum
+
+
+class DecodeState(enum.Enum):
+    IDLE = "IDLE"
+    DECODING = "DECODING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+    def isIdle(self) -> bool:
+        return self == self.__class__.IDLE
+
+    def isDecoding(self) -> bool:
+        return self == self.__class__.DECODING
+
+    def isCompleted(self) -> bool:
+        return self == self.__class__.COMPLETED
+
+    def isFailed(self) -> bool:
+        return self == self.__class__.FAILED
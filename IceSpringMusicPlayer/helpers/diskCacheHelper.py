@@ -0,0 +1,61 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 10:05
+
+import hashlib
+import logging
+import os
+import threading
+import typing
+
+from IceSpringPathLib import Path
+
+
+class DiskCacheHelper(object):
+    def __init__(self, root: str, capacity: int):
+        self._logger = logging.getLogger("diskCacheHelper")
+        self._root = Path(root)
+        self._capacity = capacity
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def calcFileKey(filename: str, *extras: typing.Any) -> str:
+        stat = os.stat(filename)
+        identity = ":".join(map(str, [os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, *extras]))
+        return hashlib.md5(identity.encode()).hexdigest()
+
+    def find(self, key: str) -> typing.Optional[Path]:
+        path = self._root / key
+        if not path.exists():
+            return None
+        os.utime(path)
+        return path
+
+    def createFile(self, key: str) -> typing.BinaryIO:
+        self._root.mkdir(parents=True, exist_ok=True)
+        return open(self._root / f"{key}.{threading.get_ident()}.part", "wb")
+
+    def commitFile(self, key: str, file: typing.BinaryIO) -> None:
+        file.close()
+        os.replace(file.name, self._root / key)
+        self._logger.info("Cache committed: %s", key)
+        self._evict(key)
+
+    @staticmethod
+    def discardFile(file: typing.BinaryIO) -> None:
+        file.close()
+        os.remove(file.name)
+
+    def _evict(self, keepKey: str) -> None:
+        with self._lock:
+            paths = [x for x in self._root.glob("*") if x.is_file() and x.suffix != ".part" and x.name != keepKey]
+            stats = sorted(((x, x.stat()) for x in paths), key=lambda x: x[1].st_mtime)
+            keepPath = self._root / keepKey
+            total = sum(x.st_size for _, x in stats) + (keepPath.stat().st_size if keepPath.exists() else 0)
+            for path, stat in stats:
+                if total <= self._capacity:
+                    break
+                try:
+                    path.unlink()
+                    total -= stat.st_size
+                    self._logger.info("Cache evicted: %s", path.name)
+                except OSError as e:
+                    self._logger.info("Cache eviction skipped: %s %s", path.name, e)
@@ -0,0 +1,37 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 9:20
+
+import subprocess
+import typing
+
+import pydub
+
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
+from IceSpringMusicPlayer.common.decoderMixin import DecoderMixin
+
+
+class FfmpegHelper(DecoderMixin):
+    @staticmethod
+    def openPcmStream(filename: str, sampleRate: int, startMillis: int = 0) -> subprocess.Popen:
+        seekArgs = ["-ss", f"{startMillis / 1000:.3f}"] if startMillis > 0 else []
+        command = [pydub.AudioSegment.converter, "-v", "quiet", "-nostdin", *seekArgs, "-i", filename,
+            "-vn", "-ac", "1", "-ar", str(sampleRate), "-f", "f32le", "-"]
+        startupInfo = getattr(subprocess, "STARTUPINFO", None)
+        startupInfo = startupInfo and startupInfo(dwFlags=subprocess.STARTF_USESHOWWINDOW)
+        return subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, startupinfo=startupInfo)
+
+    def decodeBlocks(self, job: DecodeJob, filename: str, sampleRate: int, blockSize: int,
+            startMillis: int = 0) -> typing.Iterator[memoryview]:
+        process = self.openPcmStream(filename, sampleRate, startMillis)
+        job.attachProcess(process)
+        try:
+            while True:
+                block = process.stdout.read(blockSize * 4)
+                if not block:
+                    break
+                yield memoryview(block).cast("f")
+            if process.wait() != 0 and not job.isCancelled():
+                raise RuntimeError(f"Ffmpeg exited with code {process.returncode}: {filename}")
+        finally:
+            process.poll() is None and process.kill()
+            process.wait()
@@ -2,42 +2,111 @@
 
 import array
 import ctypes
+import ctypes.util
 import math
+import threading
+import typing
 
 
 class FftHelper(object):
+    _libraryNames = ["libfftw3f-3.dll", "libfftw3f.so.3", "libfftw3f.so", "libfftw3f.3.dylib"]
+    _library: typing.Optional[ctypes.CDLL] = None
+    _libraryMissing = False
+    _plannerLock = threading.RLock()
+
+    @classmethod
+    def loadLibrary(cls) -> ctypes.CDLL:
+        if cls._library is None:
+            if cls._libraryMissing:
+                raise OSError("FFTW single precision library not found")
+            for name in filter(None, cls._libraryNames + [ctypes.util.find_library("fftw3f")]):
+                try:
+                    cls._library = ctypes.CDLL(name)
+                    break
+                except OSError:
+                    continue
+            else:
+                cls._libraryMissing = True
+                raise OSError("FFTW single precision library not found")
+        return cls._library
+
+    @classmethod
+    def isAvailable(cls) -> bool:
+        try:
+            return cls.loadLibrary() is not None
+        except OSError:
+            return False
+
     def __init__(self):
-        self.fftw3f = ctypes.CDLL(r"libfftw3f-3.dll")
+        self.fftw3f = self.loadLibrary()
         self.fftwf_plan_dft_r2c_1d = self.fftw3f.fftwf_plan_dft_r2c_1d
         self.fftwf_plan_dft_r2c_1d.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint)
         self.fftwf_plan_dft_r2c_1d.restype = ctypes.c_void_p
         self.fftwf_execute = self.fftw3f.fftwf_execute
         self.fftwf_execute.argtypes = (ctypes.c_void_p,)
         self.fftwf_execute.restype = None
+        self.fftwf_destroy_plan = self.fftw3f.fftwf_destroy_plan
+        self.fftwf_destroy_plan.argtypes = (ctypes.c_void_p,)
+        self.fftwf_destroy_plan.restype = None
+        self.fftwf_malloc = self.fftw3f.fftwf_malloc
+        self.fftwf_malloc.argtypes = (ctypes.c_size_t,)
+        self.fftwf_malloc.restype = ctypes.c_void_p
+        self.fftwf_free = self.fftw3f.fftwf_free
+        self.fftwf_free.argtypes = (ctypes.c_void_p,)
+        self.fftwf_free.restype = None
+        self._plans: typing.Dict[int, typing.Tuple[int, ctypes.Array, ctypes.Array, int, int]] = dict()
+        self._windows: typing.Dict[int, typing.Tuple[typing.List[float], float]] = dict()
+
+    def _getPlan(self, size: int) -> typing.Tuple[int, ctypes.Array, ctypes.Array, int, int]:
+        if size not in self._plans:
+            inputPtr, outputPtr = self.fftwf_malloc(size * 4), self.fftwf_malloc((size // 2 + 1) * 8)
+            inputs = (ctypes.c_float * size).from_address(inputPtr)
+            outputs = (ctypes.c_float * ((size // 2 + 1) * 2)).from_address(outputPtr)
+            with self._plannerLock:
+                plan = self.fftwf_plan_dft_r2c_1d(size, inputPtr, outputPtr, 64)
+            self._plans[size] = plan, inputs, outputs, inputPtr, outputPtr
+        return self._plans[size]
+
+    def _getWindow(self, size: int) -> typing.Tuple[typing.List[float], float]:
+        if size not in self._windows:
+            window = self.hanning(size)
+            self._windows[size] = window, sum(window)
+        return self._windows[size]
+
+    def _execute(self, inputs) -> ctypes.Array:
+        plan, planInputs, planOutputs, _, _ = self._getPlan(len(inputs))
+        ctypes.memmove(planInputs, inputs.buffer_info()[0], len(inputs) * inputs.itemsize)
+        self.fftwf_execute(plan)
+        return planOutputs
+
+    def close(self) -> None:
+        with self._plannerLock:
+            for plan, _, _, inputPtr, outputPtr in self._plans.values():
+                self.fftwf_destroy_plan(plan)
+                self.fftwf_free(inputPtr)
+                self.fftwf_free(outputPtr)
+        self._plans.clear()
+
+    def __del__(self):
+        hasattr(self, "_plans") and self.close()
 
     def rfft(self, inputs):
-        size = len(inputs)
-        outputs = array.array('f', [0.0] * (size * 2))
-        input_ptr, _ = inputs.buffer_info()
-        output_ptr, _ = outputs.buffer_info()
-        self.fftwf_execute(self.fftwf_plan_dft_r2c_1d(size, input_ptr, output_ptr, 64))
-        return outputs
+        return array.array('f', bytes(self._execute(inputs)))
 
     def rfftAbs(self, inputs):
-        outputs = self.rfft(inputs)
-        amplitudes = array.array('f', [0.0] * (len(inputs) // 2 + 1))
+        outputs = self._execute(inputs)
+        amplitudes = array.array('f', bytes(4 * (len(inputs) // 2 + 1)))
         for i in range(len(amplitudes)):
             amplitudes[i] = math.hypot(outputs[i * 2], outputs[i * 2 + 1])
         return amplitudes
 
-    def rfftDbfs(self, inputs, sampleWidth):
-        window = self.hanning(len(inputs))
+    def rfftDbfs(self, inputs):
+        window, windowSum = self._getWindow(len(inputs))
         for i in range(len(inputs)):
             inputs[i] *= window[i]
         amplitudes = self.rfftAbs(inputs)
-        windowSum = sum(window)
         for i in range(len(amplitudes)):
-            magnitude = amplitudes[i] * 2 / windowSum / (2 ** (sampleWidth * 8 - 1))
+            magnitude = amplitudes[i] * 2 / windowSum
             dbfs = -160 if magnitude < 2 ** -308 else 20 * math.log10(magnitude)
             amplitudes[i] = dbfs
         return amplitudes
@@ -0,0 +1,46 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 16:10
+
+import array
+import typing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NumpyFftHelper(object):
+    def __init__(self):
+        self._windows: typing.Dict[int, typing.Tuple["numpy.ndarray", float]] = dict()
+
+    @staticmethod
+    def isAvailable() -> bool:
+        return numpy is not None
+
+    def _getWindow(self, size: int) -> typing.Tuple["numpy.ndarray", float]:
+        if size not in self._windows:
+            window = numpy.hanning(size).astype(numpy.float32)
+            self._windows[size] = window, float(window.sum())
+        return self._windows[size]
+
+    def rfft(self, inputs):
+        outputs = numpy.fft.rfft(numpy.frombuffer(inputs, dtype=numpy.float32)).astype(numpy.complex64)
+        return array.array('f', outputs.tobytes())
+
+    def rfftAbs(self, inputs):
+        outputs = numpy.abs(numpy.fft.rfft(numpy.frombuffer(inputs, dtype=numpy.float32)))
+        return array.array('f', outputs.astype(numpy.float32).tobytes())
+
+    def rfftDbfs(self, inputs):
+        window, windowSum = self._getWindow(len(inputs))
+        magnitudes = numpy.abs(numpy.fft.rfft(numpy.frombuffer(inputs, dtype=numpy.float32) * window)) * 2 / windowSum
+        dbfs = 20 * numpy.log10(numpy.maximum(magnitudes, 1e-8))
+        return array.array('f', dbfs.astype(numpy.float32).tobytes())
+
+    @staticmethod
+    def rfftFreq(size, sampleRate):
+        return [x / (size / sampleRate) for x in range(size // 2 + 1)]
+
+    @staticmethod
+    def hanning(size):
+        return numpy.hanning(size).tolist()
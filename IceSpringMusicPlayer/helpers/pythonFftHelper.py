@@ -0,0 +1,94 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 16:50
+
+import array
+import cmath
+import math
+import typing
+
+
+class PythonFftHelper(object):
+    def __init__(self):
+        self._windows: typing.Dict[int, typing.Tuple[typing.List[float], float]] = dict()
+        self._twiddles: typing.Dict[int, typing.List[complex]] = dict()
+        self._chirps: typing.Dict[int, typing.Tuple[typing.List[complex], typing.List[complex]]] = dict()
+
+    @staticmethod
+    def isAvailable() -> bool:
+        return True
+
+    def _getWindow(self, size: int) -> typing.Tuple[typing.List[float], float]:
+        if size not in self._windows:
+            window = self.hanning(size)
+            self._windows[size] = window, sum(window)
+        return self._windows[size]
+
+    def _getTwiddles(self, size: int) -> typing.List[complex]:
+        if size not in self._twiddles:
+            self._twiddles[size] = [cmath.exp(-2j * math.pi * k / size) for k in range(size // 2)]
+        return self._twiddles[size]
+
+    def _getChirp(self, size: int) -> typing.Tuple[typing.List[complex], typing.List[complex]]:
+        if size not in self._chirps:
+            paddedSize = 1 << (2 * size - 2).bit_length()
+            chirp = [cmath.exp(-1j * math.pi * (k * k % (2 * size)) / size) for k in range(size)]
+            filters = [0j] * paddedSize
+            filters[0] = 1
+            for k in range(1, size):
+                filters[k] = filters[paddedSize - k] = chirp[k].conjugate()
+            self._chirps[size] = chirp, self._fft(filters)
+        return self._chirps[size]
+
+    def _fft(self, values: typing.List[complex]) -> typing.List[complex]:
+        size = len(values)
+        j = 0
+        for i in range(1, size):
+            bit = size >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                values[i], values[j] = values[j], values[i]
+        twiddles = self._getTwiddles(size)
+        length = 2
+        while length <= size:
+            half, step = length // 2, size // length
+            for start in range(0, size, length):
+                for k in range(half):
+                    t = twiddles[k * step] * values[start + k + half]
+                    values[start + k + half] = values[start + k] - t
+                    values[start + k] += t
+            length <<= 1
+        return values
+
+    def _rfftBins(self, inputs, func: typing.Callable[[complex], typing.Any]) -> typing.List[typing.Any]:
+        size = len(inputs)
+        if size & (size - 1) == 0:
+            return [func(x) for x in self._fft([complex(x) for x in inputs])[:size // 2 + 1]]
+        chirp, filters = self._getChirp(size)
+        paddedSize = len(filters)
+        values = self._fft([x * w for x, w in zip(inputs, chirp)] + [0j] * (paddedSize - size))
+        values = self._fft([(x * f).conjugate() for x, f in zip(values, filters)])
+        return [func(values[k].conjugate() * chirp[k] / paddedSize) for k in range(size // 2 + 1)]
+
+    def rfft(self, inputs):
+        return array.array('f', [y for x in self._rfftBins(inputs, complex) for y in (x.real, x.imag)])
+
+    def rfftAbs(self, inputs):
+        return array.array('f', self._rfftBins(inputs, abs))
+
+    def rfftDbfs(self, inputs):
+        window, windowSum = self._getWindow(len(inputs))
+        amplitudes = self.rfftAbs([x * w for x, w in zip(inputs, window)])
+        for i in range(len(amplitudes)):
+            magnitude = amplitudes[i] * 2 / windowSum
+            amplitudes[i] = -160 if magnitude < 1e-8 else 20 * math.log10(magnitude)
+        return amplitudes
+
+    @staticmethod
+    def rfftFreq(size, sampleRate):
+        return [x / (size / sampleRate) for x in range(size // 2 + 1)]
+
+    @staticmethod
+    def hanning(size):
+        return [0.5 * (1 - math.cos(2 * math.pi * i / (size - 1))) for i in range(size)]
@@ -0,0 +1,34 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 13:20
+
+import typing
+
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
+from IceSpringMusicPlayer.common.decoderMixin import DecoderMixin
+
+try:
+    import soundfile
+except (ImportError, OSError):
+    soundfile = None
+
+
+class SoundfileHelper(DecoderMixin):
+    @classmethod
+    def isDecoderAvailable(cls) -> bool:
+        return soundfile is not None
+
+    def isFileSupported(self, filename: str, sampleRate: int) -> bool:
+        try:
+            return soundfile.info(filename).samplerate == sampleRate
+        except RuntimeError:
+            return False
+
+    def decodeBlocks(self, job: DecodeJob, filename: str, sampleRate: int, blockSize: int,
+            startMillis: int = 0) -> typing.Iterator[memoryview]:
+        with soundfile.SoundFile(filename) as file:
+            assert file.samplerate == sampleRate
+            file.seek(min(startMillis * file.samplerate // 1000, file.frames))
+            for block in file.blocks(blockSize, dtype="float32", always_2d=True):
+                if job.isCancelled():
+                    break
+                block = block.mean(axis=1, dtype="float32")
+                yield memoryview(block).cast("B").cast("f")
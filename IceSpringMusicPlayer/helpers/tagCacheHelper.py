@@ -0,0 +1,72 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 20:10
+
+import dataclasses
+import logging
+import os
+import sqlite3
+import threading
+import typing
+
+from IceSpringPathLib import Path
+
+from IceSpringMusicPlayer.domains.music import Music
+
+
+class TagCacheHelper(object):
+    _fields = [x.name for x in dataclasses.fields(Music) if x.name != "filename"]
+    _flushThreshold = 256
+
+    def __init__(self, filename: str):
+        self._logger = logging.getLogger("tagCacheHelper")
+        try:
+            Path(filename).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = self._connect(filename)
+        except (OSError, sqlite3.Error) as e:
+            self._logger.warning("Open tag cache failed, use memory instead: %s %s", filename, e)
+            self._connection = self._connect(":memory:")
+        self._lock = threading.Lock()
+        self._pendingRows: typing.List[tuple] = []
+
+    def _connect(self, filename: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(filename, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS music (path TEXT PRIMARY KEY, size INTEGER, "
+            f"mtime INTEGER, {', '.join(self._fields)})")
+        return connection
+
+    def find(self, filename: str, stat: os.stat_result) -> typing.Optional[Music]:
+        try:
+            with self._lock:
+                row = self._connection.execute(f"SELECT size, mtime, {', '.join(self._fields)} FROM music "
+                    "WHERE path = ?", (os.path.abspath(filename),)).fetchone()
+        except sqlite3.Error as e:
+            self._logger.warning("Tag cache lookup failed, ignore: %s %s", filename, e)
+            return None
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        return Music(filename=filename, **dict(zip(self._fields, row[2:])))
+
+    def save(self, music: Music, stat: os.stat_result) -> None:
+        values = [getattr(music, x) for x in self._fields]
+        with self._lock:
+            self._pendingRows.append((os.path.abspath(music.filename), stat.st_size, stat.st_mtime_ns, *values))
+            if len(self._pendingRows) >= self._flushThreshold:
+                self._doFlush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._doFlush()
+
+    def _doFlush(self) -> None:
+        if len(self._pendingRows) == 0:
+            return
+        placeholders = ", ".join("?" * (len(self._fields) + 3))
+        try:
+            with self._connection:
+                self._connection.executemany(f"INSERT OR REPLACE INTO music VALUES ({placeholders})",
+                    self._pendingRows)
+            self._logger.info("Tag cache flushed: %d rows", len(self._pendingRows))
+        except sqlite3.Error as e:
+            self._logger.warning("Tag cache flush failed, drop %d rows: %s", len(self._pendingRows), e)
+        self._pendingRows.clear()
@@ -104,8 +104,10 @@ class PlaylistTable(IceTableView, PluginWidgetMixin):
         self._player.selectedMusicIndexesChanged.connect(self._onSelectedMusicIndexesChanged)
         self._player.currentMusicIndexChanged.connect(self._onCurrentMusicIndexChanged)
         self._player.musicsInserted.connect(self._onMusicsInserted)
+        self._player.musicsAppended.connect(self._onMusicsAppended)
         self._player.musicsRemoved.connect(self._onMusicsRemoved)
         self._player.musicsSorted.connect(self._onMusicsSorted)
+        self._player.musicsReplaced.connect(self._onMusicsReplaced)
         self._selectAndFollowMusics(self._player.getSelectedMusicIndexes())
         self._loadConfig()
         self._parent.widgetConfigChanged.connect(self._onWidgetConfigChanged)
@@ -242,6 +244,15 @@ class PlaylistTable(IceTableView, PluginWidgetMixin):
         self.horizontalHeader().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
         self._doResetTable()
 
+    def _onMusicsAppended(self, playlistIndex: int, oldCount: int) -> None:
+        self._logger.info("On musics appended: %d from %d", playlistIndex, oldCount)
+        if playlistIndex != self._player.getFrontPlaylistIndex():
+            self._logger.info("Appended playlist not front, return")
+            return
+        self.horizontalHeader().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
+        self.model().beginInsertRows(QtCore.QModelIndex(), oldCount, self.model().rowCount() - 1)
+        self.model().endInsertRows()
+
     def _onMusicsRemoved(self):
         self._logger.info("On musics removed, reset table")
         self.horizontalHeader().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
@@ -251,6 +262,15 @@ class PlaylistTable(IceTableView, PluginWidgetMixin):
         self._logger.info("On musics sorted, reset table")
         self._doResetTable()
 
+    def _onMusicsReplaced(self, playlistIndex: int, indexes: typing.List[int]) -> None:
+        self._logger.info("On musics replaced: %d %s", playlistIndex, indexes)
+        if playlistIndex != self._player.getFrontPlaylistIndex():
+            self._logger.info("Replaced playlist not front, return")
+            return
+        model = self.model()
+        for index in indexes:
+            model.dataChanged.emit(model.index(index, 0), model.index(index, model.columnCount() - 1))
+
     def _doResetTable(self):
         self._logger.info("Reset model")
         self.model().endResetModel()
@@ -0,0 +1,128 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 18:00
+
+import array
+import logging
+import math
+import time
+import typing
+
+from IceSpringMusicPlayer.common.mappedSamples import MappedSamples
+from IceSpringMusicPlayer.common.sampleRingBuffer import SampleRingBuffer
+from IceSpringMusicPlayer.utils.fftUtils import FftUtils
+from IceSpringSpectrumPlugin.spectrumBarMapping import SpectrumBarMapping
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SpectrumAnalyzer(object):
+    _resolutionFactors = [1, 2, 4, 8]
+    _maxDegradeLevel = 3
+    _costSmoothing = 0.1
+    _reportInterval = 5
+
+    def __init__(self, thresholds: typing.List[int], minFrequency: int, frameMillis: int, windowMillis: int,
+            overlap: int = 0, multiResolution: bool = False, budgetMillis: float = 0):
+        self._logger = logging.getLogger("spectrumAnalyzer")
+        self._thresholds = thresholds
+        self._minFrequency = minFrequency
+        self._frameMillis = frameMillis
+        self._windowMillis = windowMillis
+        self._hopMillis = max(windowMillis * (100 - overlap) / 100, 1)
+        self._budgetMillis = budgetMillis
+        self._helper = FftUtils.createBackend()
+        self._segments: typing.Dict[int, array.array] = dict()
+        self._barMappings: typing.Dict[typing.Tuple[int, int], SpectrumBarMapping] = dict()
+        self._barFactors = self._calcBarFactors(thresholds, minFrequency, windowMillis) \
+            if multiResolution else [1] * len(thresholds)
+        self._degradeLevel = 0
+        self._costMillis = 0.0
+        self._lastReportTime = time.monotonic()
+
+    @classmethod
+    def _calcBarFactors(cls, thresholds: typing.List[int], minFrequency: int, windowMillis: int) -> typing.List[int]:
+        factors = []
+        for prevThreshold, threshold in zip([minFrequency] + thresholds[:-1], thresholds):
+            bandwidth = max(threshold - prevThreshold, 1)
+            factor = next((x for x in cls._resolutionFactors if 1000 / (windowMillis * x) <= bandwidth),
+                cls._resolutionFactors[-1])
+            factors.append(factor)
+        return factors
+
+    def getBarCount(self) -> int:
+        return len(self._thresholds)
+
+    def getCostMillis(self) -> float:
+        return self._costMillis
+
+    def getDegradeLevel(self) -> int:
+        return self._degradeLevel
+
+    def analyze(self, samples: typing.Union[SampleRingBuffer, MappedSamples], sampleRate: int,
+            position: int) -> typing.Optional[typing.List[float]]:
+        startTime = time.perf_counter()
+        maxFactor = 1 if self._degradeLevel >= self._maxDegradeLevel else max(self._barFactors, default=1)
+        factors = [min(x, maxFactor) for x in self._barFactors]
+        results = {x: self._analyzeResolution(samples, sampleRate, position, x) for x in sorted({1, *factors})}
+        values = None if results[1] is None else [(results[y] or results[1])[i] for i, y in enumerate(factors)]
+        if self._budgetMillis > 0:
+            self._updateCost((time.perf_counter() - startTime) * 1000)
+        return values
+
+    def _analyzeResolution(self, samples: typing.Union[SampleRingBuffer, MappedSamples], sampleRate: int,
+            position: int, factor: int) -> typing.Optional[typing.List[float]]:
+        windowMillis, hopMillis = self._windowMillis * factor, self._hopMillis * factor
+        windowCount = max(int(self._frameMillis // hopMillis), 1)
+        windowCount = windowCount if self._degradeLevel == 0 else 1 if self._degradeLevel >= 2 else \
+            max(windowCount // 2, 1)
+        hopMillis = hopMillis if self._degradeLevel == 0 else self._frameMillis / windowCount
+        sampleCount = int(windowMillis / 1000 * sampleRate)
+        if sampleCount not in self._segments:
+            self._segments[sampleCount] = array.array('f', bytes(4 * sampleCount))
+        segments = self._segments[sampleCount]
+        centerMillis = position + self._frameMillis / 2
+        firstMillis = centerMillis - (windowCount - 1) * hopMillis / 2 - windowMillis / 2
+        powersList = []
+        for index in range(windowCount):
+            sampleIndex = max(int((firstMillis + index * hopMillis) / 1000 * sampleRate), 0)
+            if samples.copyInto(sampleIndex, segments) < sampleCount:
+                return None
+            powersList.append(self._helper.rfftDbfs(segments))
+        mappingKey = sampleRate, sampleCount
+        if mappingKey not in self._barMappings:
+            self._logger.info("Build bar mapping for %s", mappingKey)
+            frequencies = self._helper.rfftFreq(sampleCount, sampleRate)
+            self._barMappings[mappingKey] = SpectrumBarMapping(frequencies, self._thresholds, self._minFrequency)
+        return self._barMappings[mappingKey].reduce(self._averagePowers(powersList))
+
+    @staticmethod
+    def _averagePowers(powersList: typing.List[typing.Sequence[float]]) -> typing.Sequence[float]:
+        if len(powersList) == 1:
+            return powersList[0]
+        if numpy is not None:
+            magnitudes = numpy.power(10, numpy.asarray(powersList, dtype=numpy.float64) / 20).mean(axis=0)
+            return (20 * numpy.log10(numpy.maximum(magnitudes, 1e-8))).tolist()
+        averages = []
+        for values in zip(*powersList):
+            magnitude = sum(10 ** (x / 20) for x in values) / len(values)
+            averages.append(20 * math.log10(max(magnitude, 1e-8)))
+        return averages
+
+    def _updateCost(self, costMillis: float) -> None:
+        self._costMillis += (costMillis - self._costMillis) * self._costSmoothing
+        if self._costMillis > self._budgetMillis and self._degradeLevel < self._maxDegradeLevel:
+            self._degradeLevel += 1
+            self._costMillis = self._budgetMillis
+            self._logger.info("Analysis over budget (%.1f ms), degrade to level %d",
+                self._budgetMillis, self._degradeLevel)
+        elif self._costMillis < self._budgetMillis / 4 and self._degradeLevel > 0:
+            self._degradeLevel -= 1
+            self._costMillis = self._budgetMillis / 2
+            self._logger.info("Analysis under budget (%.1f ms), restore to level %d",
+                self._budgetMillis, self._degradeLevel)
+        if time.monotonic() - self._lastReportTime >= self._reportInterval:
+            self._lastReportTime = time.monotonic()
+            self._logger.info("Analysis cost: %.2f ms of %.1f ms budget per frame, degrade level %d",
+                self._costMillis, self._budgetMillis, self._degradeLevel)
@@ -0,0 +1,59 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 17:30
+
+import bisect
+import typing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SpectrumBarMapping(object):
+    def __init__(self, frequencies: typing.Sequence[float], thresholds: typing.List[int], minFrequency: int):
+        self._barCount = len(thresholds)
+        prevThresholds = [minFrequency] + thresholds[:-1]
+        self._indexes = []
+        for frequency in frequencies:
+            index = bisect.bisect_right(thresholds, frequency)
+            valid = index < self._barCount and prevThresholds[index] <= frequency
+            self._indexes.append(index if valid else -1)
+        self._binStart = next((i for i, x in enumerate(self._indexes) if x >= 0), 0)
+        self._binStop = max((i + 1 for i, x in enumerate(self._indexes) if x >= 0), default=0)
+        self._counts = [0] * self._barCount
+        for index in self._indexes[self._binStart:self._binStop]:
+            self._counts[index] += 1
+        self._gaps = self._calcGaps(frequencies, thresholds, prevThresholds)
+        if numpy is not None:
+            self._numpyIndexes = numpy.array(self._indexes[self._binStart:self._binStop], dtype=numpy.intp)
+            self._numpyCounts = numpy.array(self._counts, dtype=numpy.float64)
+            assert (self._numpyIndexes >= 0).all()
+
+    def _calcGaps(self, frequencies: typing.Sequence[float], thresholds: typing.List[int],
+            prevThresholds: typing.List[int]) -> typing.List[typing.Tuple[int, int, int, float]]:
+        gaps = []
+        for index in range(self._barCount):
+            center = (prevThresholds[index] + thresholds[index]) / 2
+            if self._counts[index] > 0 or len(frequencies) < 2 or not frequencies[0] <= center <= frequencies[-1]:
+                continue
+            right = min(max(bisect.bisect_right(frequencies, center), 1), len(frequencies) - 1)
+            ratio = (center - frequencies[right - 1]) / (frequencies[right] - frequencies[right - 1])
+            gaps.append((index, right - 1, right, ratio))
+        return gaps
+
+    def reduce(self, powers: typing.Sequence[float]) -> typing.List[float]:
+        if numpy is not None:
+            weights = numpy.asarray(powers, dtype=numpy.float64)[self._binStart:self._binStop]
+            sums = numpy.bincount(self._numpyIndexes, weights, minlength=self._barCount)
+            means = numpy.divide(sums, self._numpyCounts, out=numpy.full(self._barCount, -160.0),
+                where=self._numpyCounts > 0)
+            values = means.tolist()
+        else:
+            sums = [0.0] * self._barCount
+            for index, power in zip(self._indexes[self._binStart:self._binStop],
+                    powers[self._binStart:self._binStop]):
+                sums[index] += power
+            values = [x / y if y > 0 else -160 for x, y in zip(sums, self._counts)]
+        for index, left, right, ratio in self._gaps:
+            values[index] = powers[left] + (powers[right] - powers[left]) * ratio
+        return values
@@ -0,0 +1,85 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 19:20
+
+import time
+import typing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SpectrumSmoother(object):
+    _maxElapsedMillis = 100
+    _convergedDbfs = 0.1
+
+    def __init__(self, smoothUp: float, smoothDown: float, peakHold: int, peakFalloff: int):
+        self._smoothUp = smoothUp
+        self._smoothDown = smoothDown
+        self._peakHold = peakHold
+        self._peakFalloff = peakFalloff
+        self._smooths: typing.Union["numpy.ndarray", typing.List[float]] = []
+        self._peaks: typing.Union["numpy.ndarray", typing.List[float]] = []
+        self._holds: typing.Union["numpy.ndarray", typing.List[float]] = []
+        self._converged = False
+        self._lastTime = time.monotonic()
+
+    def isPeakEnabled(self) -> bool:
+        return self._peakHold > 0
+
+    def isConverged(self) -> bool:
+        return self._converged
+
+    def getSmooths(self) -> typing.List[float]:
+        return self._smooths.tolist() if numpy is not None else self._smooths[:]
+
+    def getPeaks(self) -> typing.List[float]:
+        if not self.isPeakEnabled():
+            return []
+        return self._peaks.tolist() if numpy is not None else self._peaks[:]
+
+    def update(self, values: typing.Sequence[float]) -> None:
+        now = time.monotonic()
+        elapsed = min((now - self._lastTime) * 1000, self._maxElapsedMillis)
+        self._lastTime = now
+        if numpy is not None:
+            self._updateArrays(numpy.asarray(values, dtype=numpy.float32), elapsed)
+        else:
+            self._updateLists(list(values), elapsed)
+
+    def _updateArrays(self, values: "numpy.ndarray", elapsed: float) -> None:
+        if len(self._smooths) != len(values):
+            self._smooths, self._peaks = values.copy(), values.copy()
+            self._holds = numpy.zeros(len(values), dtype=numpy.float32)
+        self._smooths += (values - self._smooths) * numpy.where(values < self._smooths, self._smoothDown,
+            self._smoothUp).astype(numpy.float32)
+        converged = len(values) == 0 or float(numpy.abs(values - self._smooths).max()) < self._convergedDbfs
+        if self.isPeakEnabled():
+            rising = self._smooths >= self._peaks
+            self._holds -= elapsed
+            self._holds[rising] = self._peakHold
+            self._peaks[rising] = self._smooths[rising]
+            falling = self._holds <= 0
+            self._peaks[falling] -= self._peakFalloff * elapsed / 1000
+            numpy.maximum(self._peaks, self._smooths, out=self._peaks)
+            converged = converged and bool((self._peaks - self._smooths < self._convergedDbfs).all())
+        self._converged = converged
+
+    def _updateLists(self, values: typing.List[float], elapsed: float) -> None:
+        if len(self._smooths) != len(values):
+            self._smooths, self._peaks, self._holds = values[:], values[:], [0.0] * len(values)
+        converged = True
+        for i, value in enumerate(values):
+            rate = self._smoothDown if value < self._smooths[i] else self._smoothUp
+            self._smooths[i] += (value - self._smooths[i]) * rate
+            converged = converged and abs(value - self._smooths[i]) < self._convergedDbfs
+            if not self.isPeakEnabled():
+                continue
+            if self._smooths[i] >= self._peaks[i]:
+                self._peaks[i], self._holds[i] = self._smooths[i], self._peakHold
+                continue
+            self._holds[i] -= elapsed
+            if self._holds[i] <= 0:
+                self._peaks[i] = max(self._peaks[i] - self._peakFalloff * elapsed / 1000, self._smooths[i])
+            converged = converged and self._peaks[i] - self._smooths[i] < self._convergedDbfs
+        self._converged = converged
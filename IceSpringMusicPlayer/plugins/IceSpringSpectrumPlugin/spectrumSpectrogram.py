@@ -0,0 +1,37 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 18:10
+
+from __future__ import annotations
+
+import typing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SpectrumSpectrogram(object):
+    def __init__(self, frameMillis: int, matrix: "numpy.ndarray"):
+        self._frameMillis = frameMillis
+        self._matrix = matrix
+
+    @staticmethod
+    def isAvailable() -> bool:
+        return numpy is not None
+
+    @staticmethod
+    def createMatrix(frameCount: int, barCount: int) -> "numpy.ndarray":
+        return numpy.full((frameCount, barCount), -160, dtype=numpy.float16)
+
+    def getValues(self, position: int) -> typing.Optional[typing.List[float]]:
+        index = position // self._frameMillis
+        if not 0 <= index < len(self._matrix):
+            return None
+        return self._matrix[index].tolist()
+
+    def save(self, file: typing.BinaryIO) -> None:
+        numpy.save(file, self._matrix, allow_pickle=False)
+
+    @classmethod
+    def load(cls, filename: str, frameMillis: int) -> SpectrumSpectrogram:
+        return cls(frameMillis, numpy.load(filename, mmap_mode="r", allow_pickle=False))
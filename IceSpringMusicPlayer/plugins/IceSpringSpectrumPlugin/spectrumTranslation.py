@@ -67,3 +67,30 @@ spectrumWidget_drawFrequencyLabels.zh_CN = "是否绘制频率标签"
 spectrumWidget_overlayDbfsNumbers = Text()
 spectrumWidget_overlayDbfsNumbers.en_US = "Overlay Dbfs Numbers"
 spectrumWidget_overlayDbfsNumbers.zh_CN = "覆盖分贝数"
+spectrumWidget_downsample = Text()
+spectrumWidget_downsample.en_US = "Downsample To Max Frequency"
+spectrumWidget_downsample.zh_CN = "按最高频率降采样"
+spectrumWidget_precompute = Text()
+spectrumWidget_precompute.en_US = "Precompute Spectrogram"
+spectrumWidget_precompute.zh_CN = "预计算频谱图"
+spectrumWidget_refreshRate = Text()
+spectrumWidget_refreshRate.en_US = "Refresh Rate (FPS)"
+spectrumWidget_refreshRate.zh_CN = "刷新率（帧每秒）"
+spectrumWidget_peakHold = Text()
+spectrumWidget_peakHold.en_US = "Peak Hold (ms, 0 = Off)"
+spectrumWidget_peakHold.zh_CN = "峰值保持（毫秒，0为关闭）"
+spectrumWidget_peakFalloff = Text()
+spectrumWidget_peakFalloff.en_US = "Peak Falloff (dB/s)"
+spectrumWidget_peakFalloff.zh_CN = "峰值回落速度（分贝每秒）"
+spectrumWidget_windowMillis = Text()
+spectrumWidget_windowMillis.en_US = "FFT Window (ms)"
+spectrumWidget_windowMillis.zh_CN = "FFT窗口（毫秒）"
+spectrumWidget_overlap = Text()
+spectrumWidget_overlap.en_US = "Window Overlap (%)"
+spectrumWidget_overlap.zh_CN = "窗口重叠（百分比）"
+spectrumWidget_multiResolution = Text()
+spectrumWidget_multiResolution.en_US = "Multi-Resolution Analysis"
+spectrumWidget_multiResolution.zh_CN = "多分辨率分析"
+spectrumWidget_cpuBudget = Text()
+spectrumWidget_cpuBudget.en_US = "CPU Budget Per Frame (ms)"
+spectrumWidget_cpuBudget.zh_CN = "每帧CPU预算（毫秒）"
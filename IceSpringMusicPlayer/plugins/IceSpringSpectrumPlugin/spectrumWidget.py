@@ -1,9 +1,12 @@
 # Created by BaiJiFeiLong@gmail.com at 2022/2/12 19:19
-import array
+import concurrent.futures
+import contextlib
+import dataclasses
+import hashlib
+import json
 import logging
 import math
-import random
-import statistics
+import threading
 import typing
 
 from IceSpringRealOptional.just import Just
@@ -12,15 +15,26 @@ from assertpy import assert_that
 
 import IceSpringSpectrumPlugin.spectrumTranslation as tt
 from IceSpringMusicPlayer.app import App
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
 from IceSpringMusicPlayer.common.jsonSupport import JsonSupport
 from IceSpringMusicPlayer.common.pluginWidgetMixin import PluginWidgetMixin
-from IceSpringMusicPlayer.helpers.fftHelper import FftHelper
+from IceSpringMusicPlayer.common.sampleRingBuffer import SampleRingBuffer
+from IceSpringMusicPlayer.enums.playerState import PlayerState
+from IceSpringMusicPlayer.helpers.diskCacheHelper import DiskCacheHelper
 from IceSpringMusicPlayer.utils.layoutUtils import LayoutUtils
+from IceSpringSpectrumPlugin.spectrumAnalyzer import SpectrumAnalyzer
+from IceSpringSpectrumPlugin.spectrumSmoother import SpectrumSmoother
+from IceSpringSpectrumPlugin.spectrumSpectrogram import SpectrumSpectrogram
 from IceSpringSpectrumPlugin.spectrumWidgetConfig import SpectrumWidgetConfig
 
 
 class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
     widgetConfigChanged: QtCore.SignalInstance = QtCore.Signal()
+    _spectrogramReady: QtCore.SignalInstance = QtCore.Signal(str, object)
+    _valuesReady: QtCore.SignalInstance = QtCore.Signal(object, object)
+    _spectrogramCacheCapacity = 2 ** 28
+    _spectrogramBufferSeconds = 30
+    _spectrogramBlockSize = 4096
     _widgetConfig: SpectrumWidgetConfig
     _barCount: int
     _distribution: str
@@ -29,6 +43,7 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
     _maxFrequency: int
     _smoothUp: float
     _smoothDown: float
+    _refreshRate: int
     _spacing: int
     _margins: typing.List[int]
     _drawDbfsNumbers: bool
@@ -51,24 +66,36 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
         self._widgetConfig = config or self.getWidgetConfigClass().getDefaultObject()
         self._app = App.instance()
         self._updateRate = 20
-        self._refreshRate = 60
-        self._sampleMillis = 33
         self._logger = logging.getLogger("spectrumWidget")
         self._logger.setLevel(logging.INFO)
         self._player = App.instance().getPlayer()
         self._thresholds = []
         self._values = []
         self._smooths = []
-        self._random = random.Random()
-        self._helper = FftHelper()
+        self._peaks = []
+        self._sampleCoverage = self._player.getSampleCoverage()
+        self._spectrogramCacheHelper = DiskCacheHelper("caches/spectrograms", self._spectrogramCacheCapacity)
+        self._spectrogram: typing.Optional[SpectrumSpectrogram] = None
+        self._spectrogramKey = ""
+        self._spectrogramSource = ("", 0)
+        self._spectrogramReady.connect(self._onSpectrogramReady)
+        self._analysisExecutor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="spectrum")
+        self._analysisLock = threading.Lock()
+        self._analysisRequest: typing.Optional[tuple] = None
+        self._analysisPending = False
+        self._valuesReady.connect(self._onValuesReady)
+        self.destroyed.connect(lambda *_, x=self._analysisExecutor: x.shutdown(wait=False))
         self._loadConfig()
+        self._player.samplesAvailable.connect(self._onSamplesAvailable)
+        self._player.currentMusicIndexChanged.connect(self._onCurrentMusicIndexChanged)
+        self._player.stateChanged.connect(self._onPlayerStateChanged)
+        self._converged = False
         self._updateTimer = QtCore.QTimer(self)
         self._updateTimer.timeout.connect(self._onTick)
-        self._updateTimer.start(1000 // self._updateRate)
         self._repaintTimer = QtCore.QTimer(self)
         self._repaintTimer.timeout.connect(self._doSmooth)
         self._repaintTimer.timeout.connect(self.repaint)
-        self._repaintTimer.start(1000 // self._refreshRate)
+        self._scheduleTimers()
         self.setFont(QtGui.QFont("", 10))
         self.widgetConfigChanged.connect(self._onWidgetConfigChanged)
         self.setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
@@ -87,6 +114,53 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
     def _onWidgetConfigChanged(self):
         self._logger.info("On widget config changed")
         self._loadConfig()
+        self._scheduleTimers()
+
+    def _onPlayerStateChanged(self, state: PlayerState) -> None:
+        self._logger.info("On player state changed: %s", state)
+        self._scheduleTimers()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        self.window().installEventFilter(self)
+        self.window().windowHandle() and self.window().windowHandle().installEventFilter(self)
+        self._scheduleTimers()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        super().hideEvent(event)
+        self._scheduleTimers()
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() in (QtCore.QEvent.Type.WindowStateChange, QtCore.QEvent.Type.Expose):
+            QtCore.QTimer.singleShot(0, self._scheduleTimers)
+        return super().eventFilter(watched, event)
+
+    def _isExposed(self) -> bool:
+        window = self.window()
+        handle = window.windowHandle()
+        return self.isVisible() and not window.isMinimized() and (handle is None or handle.isExposed()) \
+            and not self.visibleRegion().isEmpty()
+
+    def _scheduleTimers(self) -> None:
+        if not self._player.getState().isPlaying() or not self._isExposed():
+            if self._updateTimer.isActive() or self._repaintTimer.isActive():
+                self._logger.info("Player not playing or widget not exposed, stop timers")
+            self._updateTimer.stop()
+            self._repaintTimer.stop()
+            return
+        updateInterval = 1000 // self._updateRate
+        refreshRate = max(self._refreshRate // 4, 5) if self._converged else self._refreshRate
+        repaintInterval = 1000 // refreshRate
+        if not self._updateTimer.isActive() or self._updateTimer.interval() != updateInterval:
+            self._updateTimer.start(updateInterval)
+        if not self._repaintTimer.isActive() or self._repaintTimer.interval() != repaintInterval:
+            self._logger.debug("Repaint rate now: %d FPS", refreshRate)
+            self._repaintTimer.start(repaintInterval)
+
+    def _setConverged(self, converged: bool) -> None:
+        if converged != self._converged:
+            self._converged = converged
+            self._scheduleTimers()
 
     # noinspection DuplicatedCode
     def _loadConfig(self):
@@ -98,6 +172,13 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
         self._baseFrequency = self._widgetConfig.baseFrequency
         self._smoothUp = self._widgetConfig.smoothUp
         self._smoothDown = self._widgetConfig.smoothDown
+        self._peakHold = self._widgetConfig.peakHold
+        self._peakFalloff = self._widgetConfig.peakFalloff
+        self._refreshRate = self._widgetConfig.refreshRate
+        self._windowMillis = self._widgetConfig.windowMillis
+        self._overlap = self._widgetConfig.overlap
+        self._multiResolution = self._widgetConfig.multiResolution
+        self._cpuBudget = self._widgetConfig.cpuBudget
         self._minDbfs = self._widgetConfig.minDbfs
         self._spacing = self._widgetConfig.spacing
         self._margins = self._widgetConfig.margins
@@ -105,6 +186,7 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
         self._drawDbfsLines = self._widgetConfig.drawDbfsLines
         self._drawFrequencyLabels = self._widgetConfig.drawFrequencyLabels
         self._overlayDbfsNumbers = self._widgetConfig.overlayDbfsNumbers
+        self._player.setSampleRateLimit(self, self._maxFrequency * 2 if self._widgetConfig.downsample else 0)
         assert_that(self._distribution).is_in("EXPONENTIAL", "LINEAR")
         if self._distribution == "EXPONENTIAL":
             powerRoot = pow(self._maxFrequency / self._baseFrequency, 1 / (self._barCount - 1))
@@ -113,45 +195,191 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
             step = (self._maxFrequency - self._minFrequency) / self._barCount
             self._thresholds = [round((x + 1) * step + self._minFrequency) for x in range(self._barCount)]
         self._thresholds = [x for x in self._thresholds if x >= self._minFrequency]
+        self._analyzer = self._createAnalyzer(self._cpuBudget)
+        self._smoother = SpectrumSmoother(self._smoothUp, self._smoothDown, self._peakHold, self._peakFalloff)
+        self._spectrogram = None
+        self._spectrogramKey = ""
+        self._spectrogramSource = ("", 0)
+        self._refreshSpectrogram()
+        self._staticLayer: typing.Optional[QtGui.QPixmap] = None
+
+    def _createAnalyzer(self, budgetMillis: float) -> SpectrumAnalyzer:
+        return SpectrumAnalyzer(self._thresholds, self._minFrequency, 1000 // self._updateRate, self._windowMillis,
+            self._overlap, self._multiResolution, budgetMillis)
+
+    def _onSamplesAvailable(self, start: int, end: int) -> None:
+        self._sampleCoverage = start, end
+        if self._calcSpectrogramSource() != self._spectrogramSource:
+            QtCore.QTimer.singleShot(0, self._refreshSpectrogram)
+
+    def _onCurrentMusicIndexChanged(self, oldIndex: int, newIndex: int) -> None:
+        self._logger.info("On current music index changed: %d => %d", oldIndex, newIndex)
+        self._refreshSpectrogram()
+
+    def _calcSpectrogramKey(self, filename: str, sampleRate: int) -> str:
+        fields = ["barCount", "distribution", "baseFrequency", "minFrequency", "maxFrequency", "windowMillis",
+            "overlap", "multiResolution"]
+        config = {k: v for k, v in dataclasses.asdict(self._widgetConfig).items() if k in fields}
+        identity = json.dumps([config, self._updateRate], sort_keys=True)
+        configHash = hashlib.md5(identity.encode()).hexdigest()
+        return self._spectrogramCacheHelper.calcFileKey(filename, sampleRate, configHash)
+
+    def _calcSpectrogramSource(self) -> typing.Tuple[str, int]:
+        music = self._player.getCurrentMusic().orElse(None)
+        if music is None or not self._widgetConfig.precompute or not SpectrumSpectrogram.isAvailable():
+            return "", 0
+        return music.filename, self._player.getSampleRate()
+
+    def _refreshSpectrogram(self) -> None:
+        source = self._calcSpectrogramSource()
+        if source == self._spectrogramSource:
+            return
+        self._spectrogramSource = source
+        filename, sampleRate = source
+        if not filename:
+            self._spectrogram = None
+            return
+        key = self._calcSpectrogramKey(filename, sampleRate)
+        if key == self._spectrogramKey:
+            return
+        self._spectrogram = None
+        cachePath = self._spectrogramCacheHelper.find(key)
+        if cachePath is not None:
+            self._logger.info("Load cached spectrogram: %s", cachePath)
+            self._spectrogram = SpectrumSpectrogram.load(str(cachePath), 1000 // self._updateRate)
+            self._spectrogramKey = key
+            return
+        self._logger.info("Build spectrogram in background: %s", filename)
+        self._spectrogramKey = key
+        analyzer = self._createAnalyzer(0)
+        self._player.getDecodeScheduler().submit(
+            lambda job: self._buildSpectrogram(job, key, filename, sampleRate, analyzer))
+
+    def _buildSpectrogram(self, job: DecodeJob, key: str, filename: str, sampleRate: int,
+            analyzer: SpectrumAnalyzer) -> None:
+        frameMillis = 1000 // self._updateRate
+        bufferCount = sampleRate * self._spectrogramBufferSeconds
+        samples = SampleRingBuffer("f", bufferCount, bufferCount)
+        rows = []
+        decoder = self._player.getDecodeScheduler().findDecoder(filename, sampleRate)
+        blocks = decoder.decodeBlocks(job, filename, sampleRate, self._spectrogramBlockSize)
+        with contextlib.closing(blocks):
+            for view in blocks:
+                samples.write(view)
+                values = analyzer.analyze(samples, sampleRate, len(rows) * frameMillis)
+                while values is not None:
+                    rows.append(values)
+                    samples.setPlayhead(len(rows) * frameMillis * sampleRate // 1000)
+                    values = analyzer.analyze(samples, sampleRate, len(rows) * frameMillis)
+        if job.isCancelled():
+            self._logger.info("Spectrogram building cancelled")
+            self._spectrogramReady.emit(key, None)
+            return
+        frameCount = len(samples) * 1000 // sampleRate // frameMillis
+        matrix = SpectrumSpectrogram.createMatrix(frameCount, analyzer.getBarCount())
+        for index, values in enumerate(rows[:frameCount]):
+            matrix[index] = values
+        spectrogram = SpectrumSpectrogram(frameMillis, matrix)
+        cacheFile = self._spectrogramCacheHelper.createFile(key)
+        try:
+            spectrogram.save(cacheFile)
+        except Exception:
+            self._spectrogramCacheHelper.discardFile(cacheFile)
+            raise
+        self._spectrogramCacheHelper.commitFile(key, cacheFile)
+        self._logger.info("Spectrogram built: %d frames", frameCount)
+        self._spectrogramReady.emit(key, spectrogram)
+
+    def _onSpectrogramReady(self, key: str, spectrogram: typing.Optional[SpectrumSpectrogram]) -> None:
+        if key != self._spectrogramKey:
+            self._logger.info("Stale spectrogram, drop it")
+            return
+        if spectrogram is None:
+            self._logger.info("Spectrogram not built, retry later")
+            self._spectrogramKey = ""
+            self._spectrogramSource = ("", 0)
+            return
+        self._spectrogram = spectrogram
 
     def _onTick(self):
         self._logger.debug("On tick")
         if not self._player.getState().isPlaying():
             self._logger.debug("Player not playing, skip")
             return
-        if len(self._player.getSamples()) == 0:
-            self._logger.debug("No samples, skip")
+        if self._spectrogram is not None:
+            values = self._spectrogram.getValues(self._player.getPosition())
+            self._values = self._values if values is None else values
+            self._setConverged(False)
+            return
+        if not self._sampleCoverage[0] <= self._player.getPosition() < self._sampleCoverage[1]:
+            self._logger.debug("No samples at playhead, skip")
             return
-        self._doUpdateSpectrum()
-
-    def _doUpdateSpectrum(self):
-        self._logger.debug("Do update spectrum")
-        music = self._player.getCurrentMusic().get()
-        samples = self._player.getSamples()
-        sampleRate = music.sampleRate
-        sampleWidth = self._player.getSampleWidth()
-        sampleCount = int(self._sampleMillis / 1000 * sampleRate)
-        sampleIndex = int(self._player.getPosition() / 1000 * sampleRate)
-        segments = array.array('f', samples[sampleIndex:sampleIndex + sampleCount])
-        powers = self._helper.rfftDbfs(segments, sampleWidth)
-        frequencies = self._helper.rfftFreq(len(segments), sampleRate)
-        self._values = self.calcPowerValues(frequencies, powers, self._thresholds, self._minFrequency)
+        self._requestAnalysis()
 
-    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        spacing, barCount, minDbfs = self._spacing, self._barCount, self._minDbfs
+    def _requestAnalysis(self) -> None:
+        request = self._analyzer, self._player.getSamples(), self._player.getSampleRate(), self._player.getPosition()
+        with self._analysisLock:
+            self._analysisRequest = request
+            if self._analysisPending:
+                self._logger.debug("Analysis pending, request coalesced")
+                return
+            self._analysisPending = True
+        self._analysisExecutor.submit(self._runAnalysis)
+
+    def _runAnalysis(self) -> None:
+        with self._analysisLock:
+            analyzer, samples, sampleRate, position = self._analysisRequest
+            self._analysisPending = False
+        try:
+            values = analyzer.analyze(samples, sampleRate, position)
+            if values is None:
+                self._logger.debug("Samples not streamed to position, skip")
+                return
+            self._valuesReady.emit(analyzer, values)
+        except Exception as e:
+            self._logger.error("Spectrum analysis failed: %s", e, exc_info=e)
+
+    def _onValuesReady(self, analyzer: SpectrumAnalyzer, values: typing.List[float]) -> None:
+        if analyzer is not self._analyzer or self._spectrogram is not None:
+            self._logger.debug("Stale analysis result, drop it")
+            return
+        self._values = values
+        self._setConverged(False)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._staticLayer = None
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() in (QtCore.QEvent.Type.FontChange, QtCore.QEvent.Type.PaletteChange):
+            self._staticLayer = None
+
+    def _calcPaintGeometry(self) -> typing.Tuple[QtCore.QRect, float, int, float, int, int, int]:
+        minDbfs, barCount = self._minDbfs, self._barCount
         marginTop, marginRight, marginBottom, marginLeft = self._margins
-        drawDbfsNumbers, drawDbfsLines, drawFrequencyLabels, overlayDbfsNumbers = \
-            self._drawDbfsNumbers, self._drawDbfsLines, self._drawFrequencyLabels, self._overlayDbfsNumbers
         fontSize = self.font().pointSize()
-        labelHeight = fontSize * 2 if drawFrequencyLabels else 0
-        dbfsWidth = fontSize * 6 if drawDbfsNumbers else 0
-        tailWidth = 0 if overlayDbfsNumbers else dbfsWidth
-        thresholds, smooths = self._thresholds, self._smooths
+        labelHeight = fontSize * 2 if self._drawFrequencyLabels else 0
+        dbfsWidth = fontSize * 6 if self._drawDbfsNumbers else 0
+        tailWidth = 0 if self._overlayDbfsNumbers else dbfsWidth
         rect = QtCore.QRect(QtCore.QPoint(marginLeft, marginTop),
             QtCore.QPoint(self.width() - marginRight - 1, self.height() - marginBottom - 1))
         unitHeight = max((rect.height() - labelHeight) / (-minDbfs + 5), 0)
         headerHeight = int(unitHeight * 5)
-        painter = QtGui.QPainter(self)
+        span: float = (rect.width() - tailWidth) / barCount
+        return rect, unitHeight, headerHeight, span, fontSize, labelHeight, dbfsWidth
+
+    def _renderStaticLayer(self) -> QtGui.QPixmap:
+        self._logger.info("Render static layer")
+        minDbfs, thresholds = self._minDbfs, self._thresholds
+        drawDbfsNumbers, drawDbfsLines, drawFrequencyLabels = \
+            self._drawDbfsNumbers, self._drawDbfsLines, self._drawFrequencyLabels
+        rect, unitHeight, headerHeight, span, fontSize, labelHeight, dbfsWidth = self._calcPaintGeometry()
+        pixmap = QtGui.QPixmap(self.size() * self.devicePixelRatioF())
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(self.font())
         prevDbfsY = -10000
         for dbfs in range(0, minDbfs - 1, -10):
             y = int(-dbfs * unitHeight + headerHeight)
@@ -164,53 +392,44 @@ class SpectrumWidget(QtWidgets.QWidget, PluginWidgetMixin):
                 if dbfsY - prevDbfsY >= fontSize * 1.5 and dbfsY - rect.top() >= fontSize:
                     painter.drawText(rect.right() - dbfsWidth + fontSize // 2, dbfsY, f"{dbfs: 3}db")
                     prevDbfsY = dbfsY
-        prevLabelX, prevBarX = -10000, -10000
-        span: float = (rect.width() - tailWidth) / barCount
+        prevLabelX = -10000
         painter.setPen(QtGui.QColor("#000000"))
-        for i, (k, v) in enumerate(zip(thresholds, smooths)):
-            v = max(v, minDbfs)
-            x, y = int(i * span), math.ceil(-v * unitHeight + headerHeight)
-            w, h = max(int(span - spacing), 1), max(rect.height() - y - labelHeight, 0)
-            if x - prevBarX > spacing:
-                painter.fillRect(rect.left() + x, rect.top() + y, w, h, QtGui.QColor("#4477CC"))
-                prevBarX = x
+        for i, k in enumerate(thresholds if drawFrequencyLabels else []):
+            x = int(i * span)
             hz = str(k) if k < 1000 else ("%.1fK" if k < 10000 else "%.0fK") % (k / 1000)
             lx, ly = int(x + span / 2 - len(hz) * fontSize / 2), rect.height() - 3
-            if 0 <= lx < rect.right() - len(hz) * fontSize * 1.7 and lx - prevLabelX >= (len(hz) + 2) * fontSize \
-                    and drawFrequencyLabels:
+            if 0 <= lx < rect.right() - len(hz) * fontSize * 1.7 and lx - prevLabelX >= (len(hz) + 2) * fontSize:
                 painter.drawText(rect.left() + lx, rect.top() + ly, hz)
                 prevLabelX = lx
+        painter.end()
+        return pixmap
 
-    def calcPowerValues(self, frequencies, powers, thresholds, minFrequency):
-        self._random.seed(sum(powers))
-        prevThresholds = [minFrequency] + thresholds[:-1]
-        powerArrays = [[] for _ in range(len(thresholds))]
-        for frequency, power in zip(frequencies, powers):
-            for index, (prevThreshold, threshold) in enumerate(zip(prevThresholds, thresholds)):
-                if prevThreshold <= frequency < threshold:
-                    powerArrays[index].append(power)
-        values = []
-        for index, powerArray in enumerate(powerArrays):
-            if len(powerArray) > 0:
-                value = statistics.mean(powerArray)
-            else:
-                value = -160
-            values.append(value)
-        validIndexes = [i for i, v in enumerate(values) if v != -160]
-        if len(validIndexes) > 0:
-            for index in range(0, validIndexes[-1], 1):
-                if values[index] == -160:
-                    samples = [x for x in values[max(index - 2, 0):index + 3] if x != -160] or [
-                        x for x in values if x != -160]
-                    values[index] = statistics.mean(samples) * ((self._random.random() - 0.5) * 2 * 0.2 + 1)
-        return values
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        spacing, minDbfs, smooths, peaks = self._spacing, self._minDbfs, self._smooths, self._peaks
+        rect, unitHeight, headerHeight, span, _, labelHeight, _ = self._calcPaintGeometry()
+        if self._staticLayer is None:
+            self._staticLayer = self._renderStaticLayer()
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._staticLayer)
+        bars, caps = [], []
+        prevBarX = -10000
+        for i, v in enumerate(smooths[:len(self._thresholds)]):
+            v = max(v, minDbfs)
+            x, y = int(i * span), math.ceil(-v * unitHeight + headerHeight)
+            w, h = max(int(span - spacing), 1), max(rect.height() - y - labelHeight, 0)
+            if x - prevBarX > spacing:
+                bars.append(QtCore.QRect(rect.left() + x, rect.top() + y, w, h))
+                prevBarX = x
+                if i < len(peaks) and peaks[i] > minDbfs:
+                    py = math.ceil(-peaks[i] * unitHeight + headerHeight)
+                    caps.append(QtCore.QRect(rect.left() + x, rect.top() + min(py, y) - 2, w, 2))
+        painter.setPen(QtCore.Qt.PenStyle.NoPen)
+        painter.setBrush(QtGui.QColor("#4477CC"))
+        painter.drawRects(bars)
+        painter.setBrush(QtGui.QColor("#224488"))
+        painter.drawRects(caps)
 
     def _doSmooth(self):
-        up, down = self._smoothUp, self._smoothDown
-        if len(self._smooths) != len(self._values):
-            self._smooths = self._values[:]
-        for i in range(len(self._values)):
-            if self._values[i] < self._smooths[i]:
-                self._smooths[i] = self._values[i] * down + self._smooths[i] * (1 - down)
-            else:
-                self._smooths[i] = self._values[i] * up + self._smooths[i] * (1 - up)
+        self._smoother.update(self._values)
+        self._smooths, self._peaks = self._smoother.getSmooths(), self._smoother.getPeaks()
+        self._setConverged(self._smoother.isConverged())
@@ -21,9 +21,19 @@ class SpectrumWidgetConfig(JsonSupport):
     drawDbfsLines: bool
     drawFrequencyLabels: bool
     overlayDbfsNumbers: bool
+    downsample: bool
+    precompute: bool
+    refreshRate: int
+    peakHold: int
+    peakFalloff: int
+    windowMillis: int
+    overlap: int
+    multiResolution: bool
+    cpuBudget: int
 
     @classmethod
     def getDefaultObject(cls) -> JsonSupport:
         return cls(barCount=100, distribution="EXPONENTIAL", baseFrequency=50, minFrequency=0, maxFrequency=22000,
             smoothUp=1.0, smoothDown=0.95, minDbfs=-60, spacing=1, margins=[0, 0, 0, 0], drawDbfsNumbers=True,
-            drawDbfsLines=True, drawFrequencyLabels=True, overlayDbfsNumbers=True)
+            drawDbfsLines=True, drawFrequencyLabels=True, overlayDbfsNumbers=True, downsample=True, precompute=True,
+            refreshRate=60, peakHold=0, peakFalloff=30, windowMillis=33, overlap=50, multiResolution=True, cpuBudget=8)
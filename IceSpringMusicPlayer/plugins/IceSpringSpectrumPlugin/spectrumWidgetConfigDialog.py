@@ -57,6 +57,30 @@ class SpectrumWidgetConfigDialog(QtWidgets.QDialog):
         self._drawFrequencyLabels.setChecked(self._widgetConfig.drawFrequencyLabels)
         self._overlayDbfsNumbersCheckBox = QtWidgets.QCheckBox()
         self._overlayDbfsNumbersCheckBox.setChecked(self._widgetConfig.overlayDbfsNumbers)
+        self._downsampleCheckBox = QtWidgets.QCheckBox()
+        self._downsampleCheckBox.setChecked(self._widgetConfig.downsample)
+        self._precomputeCheckBox = QtWidgets.QCheckBox()
+        self._precomputeCheckBox.setChecked(self._widgetConfig.precompute)
+        self._refreshRateComboBox = QtWidgets.QComboBox()
+        self._refreshRateComboBox.addItems(list(map(str, [10, 15, 20, 24, 30, 48, 50, 60, 75, 90, 120, 144])))
+        self._refreshRateComboBox.setCurrentText(str(self._widgetConfig.refreshRate))
+        self._peakHoldComboBox = QtWidgets.QComboBox()
+        self._peakHoldComboBox.addItems(list(map(str, [0, *range(100, 1001, 100), 1500, 2000])))
+        self._peakHoldComboBox.setCurrentText(str(self._widgetConfig.peakHold))
+        self._peakFalloffComboBox = QtWidgets.QComboBox()
+        self._peakFalloffComboBox.addItems(list(map(str, [*range(5, 51, 5), 60, 80, 100])))
+        self._peakFalloffComboBox.setCurrentText(str(self._widgetConfig.peakFalloff))
+        self._windowMillisComboBox = QtWidgets.QComboBox()
+        self._windowMillisComboBox.addItems(list(map(str, [10, 20, 33, 46, 50, 93, 100, 186, 200])))
+        self._windowMillisComboBox.setCurrentText(str(self._widgetConfig.windowMillis))
+        self._overlapComboBox = QtWidgets.QComboBox()
+        self._overlapComboBox.addItems(list(map(str, [0, 25, 50, 75])))
+        self._overlapComboBox.setCurrentText(str(self._widgetConfig.overlap))
+        self._multiResolutionCheckBox = QtWidgets.QCheckBox()
+        self._multiResolutionCheckBox.setChecked(self._widgetConfig.multiResolution)
+        self._cpuBudgetComboBox = QtWidgets.QComboBox()
+        self._cpuBudgetComboBox.addItems(list(map(str, [1, 2, 4, 8, 16, 33])))
+        self._cpuBudgetComboBox.setCurrentText(str(self._widgetConfig.cpuBudget))
         self._buttonBox = WidgetUtils.createButtonBox(ok=True, cancel=True, apply=True)
         mainLayout = QtWidgets.QGridLayout()
         mainLayout.setColumnStretch(0, 1)
@@ -89,6 +113,24 @@ class SpectrumWidgetConfigDialog(QtWidgets.QDialog):
         mainLayout.addWidget(self._drawFrequencyLabels)
         mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_overlayDbfsNumbers))
         mainLayout.addWidget(self._overlayDbfsNumbersCheckBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_downsample))
+        mainLayout.addWidget(self._downsampleCheckBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_precompute))
+        mainLayout.addWidget(self._precomputeCheckBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_refreshRate))
+        mainLayout.addWidget(self._refreshRateComboBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_peakHold))
+        mainLayout.addWidget(self._peakHoldComboBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_peakFalloff))
+        mainLayout.addWidget(self._peakFalloffComboBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_windowMillis))
+        mainLayout.addWidget(self._windowMillisComboBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_overlap))
+        mainLayout.addWidget(self._overlapComboBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_multiResolution))
+        mainLayout.addWidget(self._multiResolutionCheckBox)
+        mainLayout.addWidget(QtWidgets.QLabel(tt.spectrumWidget_cpuBudget))
+        mainLayout.addWidget(self._cpuBudgetComboBox)
         mainLayout.addWidget(WidgetUtils.createExpandingSpacer(), mainLayout.rowCount(), 0, 1, 2)
         mainLayout.addWidget(self._buttonBox, mainLayout.rowCount(), 0, 1, 2)
         self.setLayout(mainLayout)
@@ -115,6 +157,15 @@ class SpectrumWidgetConfigDialog(QtWidgets.QDialog):
             self._widgetConfig.drawDbfsLines = self._drawDbfsLinesCheckBox.isChecked()
             self._widgetConfig.drawFrequencyLabels = self._drawFrequencyLabels.isChecked()
             self._widgetConfig.overlayDbfsNumbers = self._overlayDbfsNumbersCheckBox.isChecked()
+            self._widgetConfig.downsample = self._downsampleCheckBox.isChecked()
+            self._widgetConfig.precompute = self._precomputeCheckBox.isChecked()
+            self._widgetConfig.refreshRate = int(self._refreshRateComboBox.currentText())
+            self._widgetConfig.peakHold = int(self._peakHoldComboBox.currentText())
+            self._widgetConfig.peakFalloff = int(self._peakFalloffComboBox.currentText())
+            self._widgetConfig.windowMillis = int(self._windowMillisComboBox.currentText())
+            self._widgetConfig.overlap = int(self._overlapComboBox.currentText())
+            self._widgetConfig.multiResolution = self._multiResolutionCheckBox.isChecked()
+            self._widgetConfig.cpuBudget = int(self._cpuBudgetComboBox.currentText())
             self._target.widgetConfigChanged.emit()
         if role in [QtWidgets.QDialogButtonBox.AcceptRole, QtWidgets.QDialogButtonBox.RejectRole]:
             self.close()
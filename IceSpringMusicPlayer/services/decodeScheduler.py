@@ -0,0 +1,68 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 11:10
+
+import concurrent.futures
+import logging
+import threading
+import typing
+
+from PySide2 import QtCore
+
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
+from IceSpringMusicPlayer.common.decoderMixin import DecoderMixin
+
+
+class DecodeScheduler(QtCore.QObject):
+    def __init__(self, maxWorkers: int, decoderClasses: typing.List[typing.Type[DecoderMixin]],
+            parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self._logger = logging.getLogger("decodeScheduler")
+        self._decoders = [x() for x in decoderClasses if x.isDecoderAvailable()]
+        self._logger.info("Available decoders: %s", [x.getDecoderName() for x in self._decoders])
+        self._executor = concurrent.futures.ThreadPoolExecutor(maxWorkers, thread_name_prefix="decode")
+        self._generation = 0
+        self._jobs: typing.Set[DecodeJob] = set()
+        self._lock = threading.Lock()
+
+    def findDecoder(self, filename: str, sampleRate: int) -> DecoderMixin:
+        decoder = next(x for x in self._decoders if x.isFileSupported(filename, sampleRate))
+        self._logger.info("Use decoder %s for %s", decoder.getDecoderName(), filename)
+        return decoder
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def advanceGeneration(self) -> int:
+        with self._lock:
+            self._generation += 1
+            staleJobs = [x for x in self._jobs if x.getGeneration() < self._generation]
+        self._logger.info("Advance generation to %d, cancel %d stale jobs", self._generation, len(staleJobs))
+        for job in staleJobs:
+            job.cancel()
+        return self._generation
+
+    def submit(self, func: typing.Callable[[DecodeJob], typing.Any]) -> DecodeJob:
+        with self._lock:
+            job = DecodeJob(self._generation)
+            self._jobs.add(job)
+        self._executor.submit(self._runJob, job, func)
+        return job
+
+    def _runJob(self, job: DecodeJob, func: typing.Callable[[DecodeJob], typing.Any]) -> None:
+        try:
+            if job.isCancelled():
+                self._logger.info("Job cancelled before start, skip")
+                return
+            func(job)
+        except Exception as e:
+            self._logger.error("Decode job failed: %s", e, exc_info=e)
+        finally:
+            with self._lock:
+                self._jobs.discard(job)
+
+    def shutdown(self) -> None:
+        self._logger.info("Shutdown, cancel %d jobs", len(self._jobs))
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=False)
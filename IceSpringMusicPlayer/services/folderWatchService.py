@@ -0,0 +1,154 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 20:40
+
+import concurrent.futures
+import logging
+import os
+import threading
+import typing
+
+from IceSpringPathLib import Path
+from PySide2 import QtCore, QtWidgets
+
+from IceSpringMusicPlayer.app import App
+from IceSpringMusicPlayer.domains.music import Music
+from IceSpringMusicPlayer.domains.playlist import Playlist
+from IceSpringMusicPlayer.utils.musicUtils import MusicUtils
+from IceSpringMusicPlayer.utils.walkUtils import WalkUtils
+
+
+class FolderWatchService(QtCore.QObject):
+    _deltaReady: QtCore.SignalInstance = QtCore.Signal(object, list, list, list, list)
+
+    _debounceMillis = 1000
+
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self._logger = logging.getLogger("folderWatchService")
+        self._player = App.instance().getPlayer()
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._onDirectoryChanged)
+        self._debounceTimer = QtCore.QTimer(self)
+        self._debounceTimer.setSingleShot(True)
+        self._debounceTimer.timeout.connect(self._rescanChangedFolders)
+        self._changedDirectories: typing.Set[str] = set()
+        self._scanStates: typing.Dict[int, bool] = dict()
+        self._cancelled = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="folderWatch")
+        self._deltaReady.connect(self._onDeltaReady)
+        self._player.playlistsRemoved.connect(self._onPlaylistsRemoved)
+        App.instance().aboutToQuit.connect(self._cancelled.set)
+        App.instance().aboutToQuit.connect(lambda: self._executor.shutdown(wait=False))
+        for playlist in self._player.getPlaylists():
+            playlist.watchedFolder and self.rescan(playlist)
+
+    def addWatchedFolderFromDialog(self) -> None:
+        self._logger.info("Add watched folder from dialog")
+        folder = QtWidgets.QFileDialog.getExistingDirectory()
+        folder and self.addWatchedFolder(folder)
+
+    def addWatchedFolder(self, folder: str) -> None:
+        folder = str(Path(folder).expanduser().absolute())
+        self._logger.info("Add watched folder: %s", folder)
+        index = self._player.insertPlaylist()
+        playlist = self._player.getPlaylists()[index]
+        playlist.name = Path(folder).name or folder
+        playlist.watchedFolder = folder
+        self._player.setFrontPlaylistIndex(index)
+        self.rescan(playlist)
+
+    def rescan(self, playlist: Playlist) -> None:
+        if id(playlist) in self._scanStates:
+            self._logger.info("Scan in flight, mark dirty: %s", playlist.watchedFolder)
+            self._scanStates[id(playlist)] = True
+            return
+        self._logger.info("Rescan watched folder: %s", playlist.watchedFolder)
+        self._scanStates[id(playlist)] = False
+        knownMusics = {x.filename: x for x in playlist.musics}
+        self._executor.submit(self._scanDelta, playlist, playlist.watchedFolder, knownMusics)
+
+    def _onPlaylistsRemoved(self, indexes: typing.List[int]) -> None:
+        self._logger.info("On playlists removed: %s", indexes)
+        self._refreshWatchedDirectories()
+
+    def _onDirectoryChanged(self, directory: str) -> None:
+        self._logger.debug("On directory changed: %s", directory)
+        self._changedDirectories.add(directory)
+        self._debounceTimer.start(self._debounceMillis)
+
+    def _rescanChangedFolders(self) -> None:
+        changed, self._changedDirectories = self._changedDirectories, set()
+        self._logger.info("Rescan for %d changed directories", len(changed))
+        for playlist in self._player.getPlaylists():
+            if playlist.watchedFolder and any(self._isUnder(x, playlist.watchedFolder) for x in changed):
+                self.rescan(playlist)
+
+    def _scanDelta(self, playlist: Playlist, folder: str, knownMusics: typing.Dict[str, Music]) -> None:
+        removedFilenames, addedMusics, changedMusics, directories = [], [], [], []
+        try:
+            diskFiles = dict()
+            for filename in WalkUtils.walkFiles(folder, MusicUtils.getSupportedSuffixes(), self._cancelled.is_set,
+                    onDirectory=directories.append):
+                try:
+                    diskFiles[filename] = os.stat(filename)
+                except FileNotFoundError:
+                    continue
+            if self._cancelled.is_set():
+                self._logger.info("Scan cancelled: %s", folder)
+                return
+            removedFilenames = [x for x in knownMusics if x not in diskFiles]
+            for filename in sorted(diskFiles):
+                if self._cancelled.is_set():
+                    self._logger.info("Scan cancelled: %s", folder)
+                    return
+                try:
+                    music = MusicUtils.parseMusic(filename, diskFiles[filename])
+                except Exception as e:
+                    self._logger.warning("Parse music failed, skip: %s %s", filename, e)
+                    continue
+                if filename not in knownMusics:
+                    addedMusics.append(music)
+                elif knownMusics[filename] != music:
+                    changedMusics.append(music)
+            MusicUtils.getTagCacheHelper().flush()
+            self._logger.info("Folder delta: %s +%d -%d ~%d", folder, len(addedMusics), len(removedFilenames),
+                len(changedMusics))
+        except Exception as e:
+            self._logger.error("Scan watched folder failed: %s %s", folder, e, exc_info=e)
+            removedFilenames, addedMusics, changedMusics = [], [], []
+        self._deltaReady.emit(playlist, removedFilenames, addedMusics, changedMusics, directories)
+
+    def _onDeltaReady(self, playlist: Playlist, removedFilenames: typing.List[str], addedMusics: typing.List[Music],
+            changedMusics: typing.List[Music], directories: typing.List[str]) -> None:
+        dirty = self._scanStates.pop(id(playlist), False)
+        playlistIndex = next((i for i, x in enumerate(self._player.getPlaylists()) if x is playlist), -1)
+        if playlistIndex < 0:
+            self._logger.info("Watched playlist removed, drop delta")
+            return
+        watchedDirectories = self._watcher.directories()
+        newDirectories = [x for x in directories if x not in watchedDirectories]
+        newDirectories and self._watcher.addPaths(newDirectories)
+        removedSet, changedMap = set(removedFilenames), {x.filename: x for x in changedMusics}
+        replacedMusics = {i: changedMap[x.filename] for i, x in enumerate(playlist.musics) if x.filename in changedMap}
+        removedIndexes = {i for i, x in enumerate(playlist.musics) if x.filename in removedSet}
+        remainingFilenames = {x.filename for x in playlist.musics if x.filename not in removedSet}
+        addedMusics = [x for x in addedMusics if x.filename not in remainingFilenames]
+        self._logger.info("Apply folder delta to %s: +%d -%d ~%d", playlist.name, len(addedMusics),
+            len(removedIndexes), len(replacedMusics))
+        replacedMusics and self._player.replaceMusics(replacedMusics, playlistIndex)
+        removedIndexes and self._player.removeMusicsAtIndexes(removedIndexes, playlistIndex)
+        addedMusics and self._player.insertMusics(addedMusics, playlistIndex)
+        self._refreshWatchedDirectories()
+        if dirty:
+            self._logger.info("Folder changed during scan, rescan: %s", playlist.watchedFolder)
+            self.rescan(playlist)
+
+    @staticmethod
+    def _isUnder(path: str, root: str) -> bool:
+        path, root = os.path.normcase(path), os.path.normcase(root)
+        return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+    def _refreshWatchedDirectories(self) -> None:
+        roots = [x.watchedFolder for x in self._player.getPlaylists() if x.watchedFolder]
+        stale = [x for x in self._watcher.directories()
+            if not os.path.isdir(x) or not any(self._isUnder(x, y) for y in roots)]
+        stale and self._watcher.removePaths(stale)
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import array
+import contextlib
 import hashlib
 import logging
-import threading
+import os
+import time
 import typing
 
 import pendulum
-import psutil
-import pydub
 from IceSpringRealOptional.just import Just
 from IceSpringRealOptional.maybe import Maybe
 from IceSpringRealOptional.vector import Vector
@@ -18,13 +18,24 @@ from PySide2 import QtMultimedia, QtCore
 from assertpy import assert_that
 
 from IceSpringMusicPlayer.app import App
+from IceSpringMusicPlayer.common.decodeJob import DecodeJob
+from IceSpringMusicPlayer.common.mappedSamples import MappedSamples
 from IceSpringMusicPlayer.common.patchedMediaPlayer import PatchedMediaPlayer
+from IceSpringMusicPlayer.common.sampleRingBuffer import SampleRingBuffer
+from IceSpringMusicPlayer.common.seekTable import SeekTable
 from IceSpringMusicPlayer.domains.config import Config
 from IceSpringMusicPlayer.domains.music import Music
 from IceSpringMusicPlayer.domains.playlist import Playlist
+from IceSpringMusicPlayer.enums.decodeState import DecodeState
 from IceSpringMusicPlayer.enums.playbackMode import PlaybackMode
 from IceSpringMusicPlayer.enums.playerState import PlayerState
+from IceSpringMusicPlayer.helpers.diskCacheHelper import DiskCacheHelper
+from IceSpringMusicPlayer.helpers.ffmpegHelper import FfmpegHelper
+from IceSpringMusicPlayer.helpers.soundfileHelper import SoundfileHelper
+from IceSpringMusicPlayer.services.decodeScheduler import DecodeScheduler
 from IceSpringMusicPlayer.utils.listUtils import ListUtils
+from IceSpringMusicPlayer.utils.mp3Utils import Mp3Utils
+from IceSpringMusicPlayer.utils.musicUtils import MusicUtils
 
 if typing.TYPE_CHECKING:
     from typing import Dict
@@ -40,13 +51,21 @@ class Player(QtCore.QObject):
     playlistInserted: QtCore.SignalInstance = QtCore.Signal(int)
     playlistsRemoved: QtCore.SignalInstance = QtCore.Signal(list)
     musicsInserted: QtCore.SignalInstance = QtCore.Signal()
+    musicsAppended: QtCore.SignalInstance = QtCore.Signal(int, int)
     musicsRemoved: QtCore.SignalInstance = QtCore.Signal()
     musicsSorted: QtCore.SignalInstance = QtCore.Signal()
+    musicsReplaced: QtCore.SignalInstance = QtCore.Signal(int, list)
     stateChanged: QtCore.SignalInstance = QtCore.Signal(PlayerState)
     durationChanged: QtCore.SignalInstance = QtCore.Signal(int)
     positionChanged: QtCore.SignalInstance = QtCore.Signal(int)
     playbackModeChanged: QtCore.SignalInstance = QtCore.Signal(PlaybackMode)
     volumeChanged: QtCore.SignalInstance = QtCore.Signal(int)
+    samplesAvailable: QtCore.SignalInstance = QtCore.Signal(int, int)
+    decodeStateChanged: QtCore.SignalInstance = QtCore.Signal(DecodeState)
+    _samplesReady: QtCore.SignalInstance = QtCore.Signal(int, object)
+    _samplesProgressed: QtCore.SignalInstance = QtCore.Signal(int, int, int)
+    _decodeStateReported: QtCore.SignalInstance = QtCore.Signal(int, DecodeState)
+    _seekTableReady: QtCore.SignalInstance = QtCore.Signal(str, object)
 
     _logger: logging.Logger
     _config: Config
@@ -59,8 +78,22 @@ class Player(QtCore.QObject):
     _historyPosition: int
     _proxy: PatchedMediaPlayer
     _playedCount: int
-    _sampleWidth: int
-    _samples: array.array
+    _sampleBehindSeconds = 5
+    _sampleAheadSeconds = 30
+    _sampleBlockSize = 4096
+    _sampleCacheCapacity = 2 ** 30
+    _sampleCacheFraction = 0.25
+    _decodeWorkers = 3
+    _prefetchSeconds = 10
+    _prefetchHeadSeconds = 10
+    _sampleProgressInterval = 0.1
+    _sampleJumpSeconds = 2
+    _seekIntervalMillis = 500
+    _seekCacheCapacity = 2 ** 26
+    _sampleRate: int
+    _sampleRateLimits: typing.Dict[int, int]
+    _samples: typing.Union[SampleRingBuffer, MappedSamples]
+    _decodeState: DecodeState
 
     def __init__(self, parent: QtCore.QObject):
         super().__init__(parent)
@@ -75,8 +108,20 @@ class Player(QtCore.QObject):
         self._historyPosition = -1
         self._playedCount = 0
         self._isStoppedByTime = False
-        self._sampleWidth = 0
-        self._samples = array.array('i')
+        self._sampleRate = 0
+        self._sampleRateLimits = dict()
+        self._samples = SampleRingBuffer("f", 0, 0)
+        self._sampleCacheHelper = DiskCacheHelper("caches/samples", self._sampleCacheCapacity)
+        self._decodeScheduler = DecodeScheduler(self._decodeWorkers, [SoundfileHelper, FfmpegHelper], self)
+        self._decodeState = DecodeState.IDLE
+        self._samplesReady.connect(self._onSamplesReady)
+        self._samplesProgressed.connect(self._onSamplesProgressed)
+        self._decodeStateReported.connect(self._onDecodeStateReported)
+        self._seekCacheHelper = DiskCacheHelper("caches/seeks", self._seekCacheCapacity)
+        self._seekTableReady.connect(self._onSeekTableReady)
+        self._prefetchGeneration = -1
+        self._prefetched: typing.Optional[typing.Tuple[str, int, array.array]] = None
+        App.instance().aboutToQuit.connect(self._decodeScheduler.shutdown)
         self._proxy = PatchedMediaPlayer()
         self._proxy.setVolume(50)
         self._proxy.stateChanged.connect(self._onProxyStateChanged)
@@ -106,6 +151,11 @@ class Player(QtCore.QObject):
         self.durationChanged.emit(duration)
 
     def _onProxyPositionChanged(self, position):
+        self._samples.setPlayhead(int(position / 1000 * self._sampleRate))
+        if self._proxy.duration() - position <= self._prefetchSeconds * 1000 \
+                and self._prefetchGeneration != self._decodeScheduler.getGeneration():
+            self._prefetchGeneration = self._decodeScheduler.getGeneration()
+            self._prefetchNext()
         self.positionChanged.emit(position)
 
     def getDuration(self) -> int:
@@ -335,9 +385,8 @@ class Player(QtCore.QObject):
         self._proxy.blockSignals(True)
         self._proxy.setMedia(QtMultimedia.QMediaContent(QtCore.QUrl.fromLocalFile(music.filename)),
             realDuration=music.duration)
-        self._sampleWidth = 0
-        self._samples = array.array("i")
-        threading.Thread(target=self._setupSamples, args=(music.filename,)).start()
+        self._startSamples(music)
+        self._decodeScheduler.submit(lambda job: self._setupSeekTable(music.filename))
         self._proxy.blockSignals(False)
         self._logger.info("Music content set to player.")
         self._logger.info("Update current music index")
@@ -348,38 +397,278 @@ class Player(QtCore.QObject):
         self._playedCount += 1
         self._logger.info("Played count now: %d", self._playedCount)
 
-    @staticmethod
-    def _killFfmpeg() -> int:
-        processes: typing.List[psutil.Process] = psutil.Process().children(recursive=True)
-        ffmpegs = [x for x in processes if x.name().startswith("ffmpeg")]
-        list(x.kill() for x in ffmpegs)
-        return len(ffmpegs)
+    def _prefetchNext(self) -> None:
+        self._logger.info("Prefetch next")
+        if self._playbackMode.isRepeat():
+            self._logger.info("Playback mode is repeat, nothing to prefetch")
+            return
+        nextMusicIndex = self._calcNextMusicIndex()
+        if nextMusicIndex in (-1, self._currentMusicIndex):
+            self._logger.info("No other music to prefetch, skip")
+            return
+        music = self.getCurrentPlaylist().orElseThrow(AssertionError).musics[nextMusicIndex]
+        self._logger.info("Prefetching music at index %d: %s", nextMusicIndex, music.filename)
+        sampleRate = self._calcSampleRate(music.sampleRate)
+        self._decodeScheduler.submit(lambda job: self._prefetchMusic(job, music.filename, sampleRate))
+
+    def _prefetchMusic(self, job: DecodeJob, filename: str, sampleRate: int) -> None:
+        self._logger.info("Warming page cache: %s", filename)
+        with open(filename, "rb") as file:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while not job.isCancelled() and file.read(2 ** 20):
+                    pass
+        self._logger.info("Parsing tags: %s", filename)
+        MusicUtils.parseMusic(filename)
+        self._logger.info("Loading seek table: %s", filename)
+        self._loadSeekTable(filename)
+        if self._sampleCacheHelper.find(self._sampleCacheHelper.calcFileKey(filename, sampleRate, "f32le")):
+            self._logger.info("Samples already cached, skip head decoding")
+            return
+        self._logger.info("Decoding head samples: %s", filename)
+        head = array.array("f")
+        decoder = self._decodeScheduler.findDecoder(filename, sampleRate)
+        with contextlib.closing(decoder.decodeBlocks(job, filename, sampleRate, self._sampleBlockSize)) as blocks:
+            for view in blocks:
+                head.frombytes(view.cast("B"))
+                if job.isCancelled() or len(head) >= sampleRate * self._prefetchHeadSeconds:
+                    break
+        if not job.isCancelled():
+            self._logger.info("Prefetched %d head samples: %s", len(head), filename)
+            self._prefetched = filename, sampleRate, head
+
+    def _loadSeekTable(self, filename: str) -> typing.Optional[SeekTable]:
+        if not filename.lower().endswith(".mp3"):
+            return None
+        cacheKey = self._seekCacheHelper.calcFileKey(filename, self._seekIntervalMillis, "seek")
+        cachePath = self._seekCacheHelper.find(cacheKey)
+        if cachePath is not None:
+            self._logger.info("Use cached seek table: %s", cachePath)
+            return SeekTable.fromBytes(cachePath.read_bytes())
+        self._logger.info("Scanning mp3 frames: %s", filename)
+        seekTable = Mp3Utils.scanSeekTable(filename, self._seekIntervalMillis)
+        if seekTable is None:
+            self._logger.info("No mp3 frame found, skip")
+            return None
+        cacheFile = self._seekCacheHelper.createFile(cacheKey)
+        cacheFile.write(seekTable.toBytes())
+        self._seekCacheHelper.commitFile(cacheKey, cacheFile)
+        return seekTable
+
+    def _setupSeekTable(self, filename: str) -> None:
+        seekTable = self._loadSeekTable(filename)
+        if seekTable is not None:
+            self._seekTableReady.emit(filename, seekTable)
+
+    def _onSeekTableReady(self, filename: str, seekTable: SeekTable) -> None:
+        if self.getCurrentMusic().map(lambda x: x.filename).orElse(None) != filename:
+            self._logger.info("Seek table of non-current music, drop it: %s", filename)
+            return
+        self._logger.info("Seek table ready: %s", filename)
+        self._proxy.setSeekTable(seekTable)
+
+    def _startSamples(self, music: Music) -> None:
+        self._logger.info("Start samples: %s", music.filename)
+        prefetched = self._prefetched
+        self._prefetched = None
+        sampleRate = self._calcSampleRate(music.sampleRate)
+        head = prefetched[2] if prefetched and prefetched[:2] == (music.filename, sampleRate) else None
+        self._logger.info("Prefetched head samples: %d", 0 if head is None else len(head))
+        generation = self._decodeScheduler.advanceGeneration()
+        self._logger.info("Decode generation now: %d, sample rate: %d", generation, sampleRate)
+        self._sampleRate = sampleRate
+        self._samples = SampleRingBuffer("f", 0, 0)
+        self._setDecodeState(DecodeState.DECODING)
+        self.samplesAvailable.emit(0, 0)
+        cacheable = self._isSampleCacheable(music.duration, sampleRate)
+        self._decodeScheduler.submit(lambda job: self._setupSamples(job, music.filename, sampleRate, head, cacheable))
+
+    def _isSampleCacheable(self, duration: int, sampleRate: int) -> bool:
+        cacheable = duration * sampleRate // 1000 * 4 <= self._sampleCacheCapacity * self._sampleCacheFraction
+        cacheable or self._logger.info("Samples too large to cache: %d ms at %d Hz", duration, sampleRate)
+        return cacheable
+
+    def _calcSampleRateLimit(self) -> int:
+        limits = self._sampleRateLimits.values()
+        return 0 if len(limits) == 0 or 0 in limits else max(limits)
+
+    def _calcSampleRate(self, nativeSampleRate: int) -> int:
+        limit = self._calcSampleRateLimit()
+        return nativeSampleRate if limit <= 0 else min(nativeSampleRate, limit)
+
+    def getSampleRate(self) -> int:
+        return self._sampleRate
+
+    def setSampleRateLimit(self, owner: QtCore.QObject, limit: int) -> None:
+        key = id(owner)
+        self._logger.info("Set sample rate limit of %s: %s => %d", key, self._sampleRateLimits.get(key), limit)
+        if self._sampleRateLimits.get(key) == limit:
+            self._logger.info("No change, skip")
+            return
+        if key not in self._sampleRateLimits:
+            owner.destroyed.connect(lambda *_: self._removeSampleRateLimit(key))
+        self._sampleRateLimits[key] = limit
+        self._onSampleRateLimitChanged()
+
+    def _removeSampleRateLimit(self, key: int) -> None:
+        self._logger.info("Remove sample rate limit of %s", key)
+        self._sampleRateLimits.pop(key, None) is not None and self._onSampleRateLimitChanged()
+
+    def _onSampleRateLimitChanged(self) -> None:
+        self._logger.info("Effective sample rate limit: %d", self._calcSampleRateLimit())
+        music = self.getCurrentMusic().orElse(None)
+        if music is not None and self._calcSampleRate(music.sampleRate) != self._sampleRate:
+            self._logger.info("Sample rate of current music changed, restart samples")
+            self._startSamples(music)
+
+    def _onSamplesReady(self, generation: int, samples: typing.Union[SampleRingBuffer, MappedSamples]) -> None:
+        if generation != self._decodeScheduler.getGeneration():
+            self._logger.info("Stale samples of generation %d, drop it", generation)
+            samples.close()
+            return
+        self._logger.info("Samples of generation %d ready", generation)
+        self._samples is not samples and self._samples.close()
+        self._samples = samples
+        self._samples.setPlayhead(int(self._proxy.position() / 1000 * self._sampleRate))
+        self.samplesAvailable.emit(*self.getSampleCoverage())
+
+    def _onSamplesProgressed(self, generation: int, start: int, end: int) -> None:
+        if generation != self._decodeScheduler.getGeneration():
+            return
+        self.samplesAvailable.emit(start * 1000 // self._sampleRate, end * 1000 // self._sampleRate)
 
-    def _setupSamples(self, filename):
-        self._logger.info("Setting up samples...")
-        try:
-            self._logger.info("Killing ffmpeg processes...")
-            count = self._killFfmpeg()
-            self._logger.info("killed count: %d", count)
-        except Exception as e:
-            self._logger.error("Ffmpeg kill failed: %s", e)
+    def _onDecodeStateReported(self, generation: int, state: DecodeState) -> None:
+        if generation != self._decodeScheduler.getGeneration():
+            self._logger.info("Stale decode state of generation %d, drop it", generation)
+            return
+        self._setDecodeState(state)
+
+    def _setDecodeState(self, state: DecodeState) -> None:
+        if state == self._decodeState:
+            return
+        self._logger.info("Decode state changed: %s => %s", self._decodeState, state)
+        self._decodeState = state
+        self.decodeStateChanged.emit(state)
+
+    def getDecodeState(self) -> DecodeState:
+        return self._decodeState
+
+    def getSampleCoverage(self) -> typing.Tuple[int, int]:
+        if self._sampleRate == 0:
+            return 0, 0
+        start, end = self._samples.getRange()
+        return start * 1000 // self._sampleRate, end * 1000 // self._sampleRate
+
+    def isSampleCovered(self, position: int, millis: int) -> bool:
+        start, end = self.getSampleCoverage()
+        return start <= position and position + millis <= end
+
+    def _setupSamples(self, job: DecodeJob, filename: str, sampleRate: int,
+            head: typing.Optional[array.array], cacheable: bool) -> None:
         try:
-            self._logger.info("Setting up head samples...")
-            segment = pydub.AudioSegment.from_file(filename, duration=3)
-            samples = segment.set_channels(1).get_array_of_samples()
-            self._sampleWidth = segment.sample_width
-            self._samples = samples
-            self._logger.info("Setting up whole samples...")
-            self._samples = pydub.AudioSegment.from_file(filename).set_channels(1).get_array_of_samples()
-            self._logger.info("Samples set up.")
-        except Exception as e:
-            self._logger.error("Samples set up failed: %s", e)
+            self._doSetupSamples(job, filename, sampleRate, head, cacheable)
+        except Exception:
+            self._decodeStateReported.emit(job.getGeneration(), DecodeState.FAILED)
+            raise
 
-    def getSamples(self) -> array.array:
+    def _doSetupSamples(self, job: DecodeJob, filename: str, sampleRate: int,
+            head: typing.Optional[array.array], cacheable: bool) -> None:
+        self._logger.info("Setting up samples...")
+        cacheKey = self._sampleCacheHelper.calcFileKey(filename, sampleRate, "f32le")
+        cachePath = self._sampleCacheHelper.find(cacheKey)
+        if cachePath is not None:
+            self._logger.info("Setting up cached samples: %s", cachePath)
+            self._samplesReady.emit(job.getGeneration(), MappedSamples(str(cachePath), "f"))
+            self._decodeStateReported.emit(job.getGeneration(), DecodeState.COMPLETED)
+            self._logger.info("Samples set up.")
+            return
+        self._logger.info("Setting up streaming samples...")
+        samples = SampleRingBuffer("f", sampleRate * self._sampleBehindSeconds,
+            sampleRate * self._sampleAheadSeconds, sampleRate * self._sampleJumpSeconds)
+        job.onCancel(samples.close)
+        skipCount = 0 if head is None else len(head)
+        skipCount and samples.write(memoryview(head))
+        self._samplesReady.emit(job.getGeneration(), samples)
+        decoder = self._decodeScheduler.findDecoder(filename, sampleRate)
+        startMillis = 0
+        cacheFilling = False
+        while not samples.isClosed():
+            cacheFile = self._sampleCacheHelper.createFile(cacheKey) if startMillis == 0 and cacheable else None
+            completed = False
+            progressTime = time.monotonic()
+            try:
+                blocks = decoder.decodeBlocks(job, filename, sampleRate, self._sampleBlockSize, startMillis)
+                with contextlib.closing(blocks):
+                    for view in blocks:
+                        cacheFile is not None and cacheFile.write(view)
+                        view, skipCount = view[min(skipCount, len(view)):], max(skipCount - len(view), 0)
+                        if not samples.write(view):
+                            break
+                        if time.monotonic() - progressTime >= self._sampleProgressInterval:
+                            progressTime = time.monotonic()
+                            self._samplesProgressed.emit(job.getGeneration(), *samples.getRange())
+                    else:
+                        completed = not job.isCancelled()
+            finally:
+                if cacheFile is not None and completed and cacheFile.tell() > 0:
+                    self._logger.info("Stream completed, commit samples to cache")
+                    self._sampleCacheHelper.commitFile(cacheKey, cacheFile)
+                elif cacheFile is not None:
+                    self._sampleCacheHelper.discardFile(cacheFile)
+            if completed:
+                self._samplesProgressed.emit(job.getGeneration(), *samples.getRange())
+            if completed and startMillis == 0:
+                self._decodeStateReported.emit(job.getGeneration(), DecodeState.COMPLETED)
+            cachePath = self._sampleCacheHelper.find(cacheKey) if completed and startMillis == 0 else None
+            if cachePath is not None:
+                self._logger.info("Switch to cached samples: %s", cachePath)
+                self._samplesReady.emit(job.getGeneration(), MappedSamples(str(cachePath), "f"))
+                break
+            if not samples.waitPlayheadOutside():
+                break
+            startMillis = samples.getPlayhead() * 1000 // sampleRate
+            self._logger.info("Playhead outside stream window, restart stream at %d ms", startMillis)
+            self._decodeStateReported.emit(job.getGeneration(), DecodeState.DECODING)
+            samples.reset(startMillis * sampleRate // 1000)
+            skipCount = 0
+            if startMillis > 0 and cacheable and not cacheFilling:
+                self._logger.info("Stream restarted in the middle, fill cache in background")
+                self._decodeScheduler.submit(lambda x: self._fillSamples(x, filename, sampleRate))
+                cacheFilling = True
+        self._logger.info("Samples set up.")
+
+    def _fillSamples(self, job: DecodeJob, filename: str, sampleRate: int) -> None:
+        self._logger.info("Filling samples cache: %s", filename)
+        cacheKey = self._sampleCacheHelper.calcFileKey(filename, sampleRate, "f32le")
+        cacheFile = self._sampleCacheHelper.createFile(cacheKey)
+        completed = False
+        try:
+            decoder = self._decodeScheduler.findDecoder(filename, sampleRate)
+            blocks = decoder.decodeBlocks(job, filename, sampleRate, self._sampleBlockSize)
+            with contextlib.closing(blocks):
+                for view in blocks:
+                    cacheFile.write(view)
+            completed = not job.isCancelled() and cacheFile.tell() > 0
+        finally:
+            if completed:
+                self._sampleCacheHelper.commitFile(cacheKey, cacheFile)
+            else:
+                self._sampleCacheHelper.discardFile(cacheFile)
+        if completed:
+            self._logger.info("Samples cache filled, switch to cached samples")
+            cachePath = self._sampleCacheHelper.find(cacheKey)
+            cachePath is not None and self._samplesReady.emit(job.getGeneration(), MappedSamples(str(cachePath), "f"))
+            self._decodeStateReported.emit(job.getGeneration(), DecodeState.COMPLETED)
+
+    def getSamples(self) -> typing.Union[SampleRingBuffer, MappedSamples]:
         return self._samples
 
-    def getSampleWidth(self) -> int:
-        return self._sampleWidth
+    def isSampleComplete(self) -> bool:
+        return isinstance(self._samples, MappedSamples)
+
+    def getDecodeScheduler(self) -> DecodeScheduler:
+        return self._decodeScheduler
 
     def playMusicAtIndex(self, index: int) -> None:
         self._logger.info("Play music at index: %d", index)
@@ -419,7 +708,8 @@ class Player(QtCore.QObject):
     def _timePlayNext(self):
         self._logger.info("Time play next")
         if self._playbackMode.isRepeat():
-            self._logger.info("Playback mode is repeat, resume play")
+            self._logger.info("Playback mode is repeat, restart samples and resume play")
+            self._startSamples(self.getCurrentMusic().orElseThrow(AssertionError))
             self._proxy.play()
             return
         nextMusicIndex = self._calcNextMusicIndex()
@@ -467,13 +757,14 @@ class Player(QtCore.QObject):
             else randomPreviousMusicIndex
         return loopPreviousMusicIndex if self._playbackMode.isLoop() else nonLoopPreviousMusicIndex
 
-    def insertMusics(self, musics: typing.List[Music]) -> None:
+    def insertMusics(self, musics: typing.List[Music], playlistIndex: typing.Optional[int] = None) -> None:
         self._logger.info("Inserting musics with count %d", len(musics))
         if self._playlists.isEmpty():
             self._logger.info("No playlist, create one")
             self.insertPlaylist()
             self._logger.info("Playlist inserted")
-        playlist = self.getFrontPlaylist().orElseThrow(AssertionError)
+        playlistIndex = self._frontPlaylistIndex if playlistIndex is None else playlistIndex
+        playlist = self._playlists[playlistIndex]
         oldCount = playlist.musics.size()
         oldMusics = playlist.musics[:]
         indexMap = ListUtils.calcIndexMap(oldMusics, playlist.musics)
@@ -482,11 +773,24 @@ class Player(QtCore.QObject):
         self._logger.info("Refresh selected indexes")
         playlist.selectedIndexes = {x + oldCount for x in range(len(musics))}
         self._logger.info("Reset current playlist if necessary")
-        self._resetCurrentPlaylistIfNecessary(indexMap)
+        self._resetCurrentPlaylistIfNecessary(indexMap, playlistIndex)
         self._logger.info("> musicsInserted signal emitting...")
         self.musicsInserted.emit()
         self._logger.info("< musicsInserted signal emitted...")
 
+    def appendMusics(self, musics: typing.List[Music], playlistIndex: int) -> None:
+        self._logger.info("Appending musics with count %d to playlist %d", len(musics), playlistIndex)
+        if len(musics) == 0:
+            self._logger.info("No music to append, skip")
+            return
+        playlist = self._playlists[playlistIndex]
+        oldCount = playlist.musics.size()
+        self._logger.info("Do append, keep selection and histories")
+        playlist.musics.extend(musics)
+        self._logger.info("> Signal musicsAppended emitting...")
+        self.musicsAppended.emit(playlistIndex, oldCount)
+        self._logger.info("< Signal musicsAppended emitted.")
+
     def removeSelectedMusics(self):
         self._logger.info("Remove selected musics")
         playlist = self.getFrontPlaylist().orElse(None)
@@ -500,14 +804,15 @@ class Player(QtCore.QObject):
         self._logger.info("Do remove selected musics")
         self.removeMusicsAtIndexes(indexes)
 
-    def removeMusicsAtIndexes(self, indexes: typing.Set[int]) -> None:
+    def removeMusicsAtIndexes(self, indexes: typing.Set[int], playlistIndex: typing.Optional[int] = None) -> None:
         indexes = sorted(indexes)
         self._logger.info("Removing musics at indexes: %s", indexes)
         if len(indexes) == 0:
             self._logger.info("No music to remove, skip")
             return
-        playlist = self.getFrontPlaylist().orElseThrow(AssertionError)
-        if self._frontPlaylistIndex == self._currentPlaylistIndex and self._currentMusicIndex in indexes:
+        playlistIndex = self._frontPlaylistIndex if playlistIndex is None else playlistIndex
+        playlist = self._playlists[playlistIndex]
+        if playlistIndex == self._currentPlaylistIndex and self._currentMusicIndex in indexes:
             self._logger.info("Playing music in removed list, stop it")
             self.stop()
         self._logger.info("Do remove")
@@ -523,11 +828,25 @@ class Player(QtCore.QObject):
         else:
             playlist.selectedIndexes = set()
         self._logger.info("Reset current playlist if necessary")
-        self._resetCurrentPlaylistIfNecessary(indexMap)
+        self._resetCurrentPlaylistIfNecessary(indexMap, playlistIndex)
         self._logger.info("> Signal musicsRemoved emitting...")
         self.musicsRemoved.emit()
         self._logger.info("< Signal musicsRemoved emitted.")
 
+    def replaceMusics(self, musics: typing.Dict[int, Music], playlistIndex: typing.Optional[int] = None) -> None:
+        self._logger.info("Replacing musics at indexes: %s", sorted(musics))
+        if len(musics) == 0:
+            self._logger.info("No music to replace, skip")
+            return
+        playlistIndex = self._frontPlaylistIndex if playlistIndex is None else playlistIndex
+        playlist = self._playlists[playlistIndex]
+        self._logger.info("Do replace in place, keep current music and histories")
+        for index, music in musics.items():
+            playlist.musics[index] = music
+        self._logger.info("> Signal musicsReplaced emitting...")
+        self.musicsReplaced.emit(playlistIndex, sorted(musics))
+        self._logger.info("< Signal musicsReplaced emitted.")
+
     def sortMusics(self, key, reverse=False):
         self._logger.info("Sort front playlist")
         playlist = self.getFrontPlaylist().orElseThrow(AssertionError)
@@ -543,9 +862,10 @@ class Player(QtCore.QObject):
         self.musicsSorted.emit()
         self._logger.info("< Signal musicsSorted emitted.")
 
-    def _resetCurrentPlaylistIfNecessary(self, indexMap):
-        if self._frontPlaylistIndex != self._currentPlaylistIndex:
-            self._logger.info("Front playlist is not current, skip")
+    def _resetCurrentPlaylistIfNecessary(self, indexMap, playlistIndex: typing.Optional[int] = None):
+        playlistIndex = self._frontPlaylistIndex if playlistIndex is None else playlistIndex
+        if playlistIndex != self._currentPlaylistIndex:
+            self._logger.info("Changed playlist is not current, skip")
             return
         self._logger.info("Reset current playlist")
         newCurrentMusicIndex = indexMap.get(self._currentMusicIndex, -1)
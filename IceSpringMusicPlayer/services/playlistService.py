@@ -1,22 +1,48 @@
 # Created by BaiJiFeiLong@gmail.com at 2022/1/23 19:45
+import collections
+import concurrent.futures
 import logging
+import os
+import threading
+import time
 import typing
 
 from IceSpringPathLib import Path
 from PySide2 import QtCore, QtWidgets
 
 from IceSpringMusicPlayer.app import App
+from IceSpringMusicPlayer.common.importJob import ImportJob
 from IceSpringMusicPlayer.domains.music import Music
 from IceSpringMusicPlayer.utils.musicUtils import MusicUtils
+from IceSpringMusicPlayer.utils.walkUtils import WalkUtils
 
 
 class PlaylistService(QtCore.QObject):
-    musicParsed: QtCore.SignalInstance = QtCore.Signal(int, int, Music)
+    importProgressChanged: QtCore.SignalInstance = QtCore.Signal(int, int)
+    importFinished: QtCore.SignalInstance = QtCore.Signal(int, int, bool)
+    _musicsChunkParsed: QtCore.SignalInstance = QtCore.Signal(object, list)
+    _importJobFinished: QtCore.SignalInstance = QtCore.Signal(object)
+
+    _importChunkSize = 256
+    _importChunkSeconds = 0.25
+    _importWindowSize = 64
+    _importProgressMillis = 100
 
     def __init__(self, parent: QtCore.QObject = None):
         super().__init__(parent)
         self._logger = logging.getLogger("playlistService")
         self._player = App.instance().getPlayer()
+        self._importExecutor = concurrent.futures.ThreadPoolExecutor(
+            min(os.cpu_count() or 1, 8), thread_name_prefix="import")
+        self._musicsChunkParsed.connect(self._onMusicsChunkParsed)
+        self._importJobFinished.connect(self._onImportJobFinished)
+        self._importJobs: typing.List[ImportJob] = []
+        self._importProgress = (-1, -1)
+        self._importProgressTimer = QtCore.QTimer(self)
+        self._importProgressTimer.timeout.connect(self._reportImportProgress)
+        App.instance().aboutToQuit.connect(self.cancelImports)
+        App.instance().aboutToQuit.connect(lambda: self._importExecutor.shutdown(wait=False))
+        App.instance().aboutToQuit.connect(lambda: MusicUtils.getTagCacheHelper().flush())
 
     def addMusicsFromFolderDialog(self):
         self._logger.info("Add musics from folder dialog")
@@ -25,15 +51,20 @@ class PlaylistService(QtCore.QObject):
 
     def addMusicsFromFolder(self, folder: str) -> None:
         self._logger.info("Add musics from folder: %s", folder)
-        paths = Path(folder).expanduser().glob("**/*.mp3")
-        filenames = [str(x) for x in paths]
-        self.addMusicsFromFilenames(filenames)
+        if not folder:
+            self._logger.info("No folder selected, return")
+            return
+        job = ImportJob(folder)
+        filenames = WalkUtils.walkFiles(str(Path(folder).expanduser()), MusicUtils.getSupportedSuffixes(),
+            job.isCancelled, lambda dirs, files: self._logger.debug("Walked %d dirs, found %d files", dirs, files))
+        self._startImport(job, filenames, None)
 
     def addMusicsFromFileDialog(self):
         self._logger.info("Add musics from file dialog")
         musicRoot = str(Path("~/Music").expanduser().absolute())
+        patterns = " ".join("*" + x for x in MusicUtils.getSupportedSuffixes())
         filenames = QtWidgets.QFileDialog.getOpenFileNames(
-            None, "Open music files", musicRoot, "Audio files (*.mp3 *.wma) ;; All files (*)")[0]
+            None, "Open music files", musicRoot, f"Audio files ({patterns}) ;; All files (*)")[0]
         self._logger.info("There are %d files to open", len(filenames))
         self.addMusicsFromFilenames(filenames)
 
@@ -42,17 +73,114 @@ class PlaylistService(QtCore.QObject):
         if len(filenames) == 0:
             self._logger.info("No musics to add, return")
             return
-        musics = []
-        for index, filename in enumerate(filenames):
-            music = MusicUtils.parseMusic(filename)
-            musics.append(music)
-            self.musicParsed.emit(index + 1, len(filenames), music)
-        self._player.insertMusics(musics)
+        self._startImport(ImportJob("files"), filenames, len(filenames))
+
+    def isImporting(self) -> bool:
+        return len(self._importJobs) > 0
+
+    def cancelImports(self) -> None:
+        self._logger.info("Cancel %d imports", len(self._importJobs))
+        for job in self._importJobs:
+            job.cancel()
+
+    def _startImport(self, job: ImportJob, filenames: typing.Iterable[str], total: typing.Optional[int]) -> None:
+        if self._player.getPlaylists().isEmpty():
+            self._logger.info("No playlist, create one")
+            self._player.insertPlaylist()
+        job.setPlaylist(self._player.getFrontPlaylist().orElseThrow(AssertionError))
+        job.setProgress(0, total or 0)
+        self._importJobs.append(job)
+        self._reportImportProgress()
+        self._importProgressTimer.start(self._importProgressMillis)
+        threading.Thread(target=self._importMusics, args=(job, filenames, total), name="importer",
+            daemon=True).start()
+
+    def _parseMusic(self, filename: str) -> typing.Optional[Music]:
+        try:
+            return MusicUtils.parseMusic(filename)
+        except Exception as e:
+            self._logger.warning("Parse music failed, skip: %s %s", filename, e)
+            return None
+
+    def _importMusics(self, job: ImportJob, filenames: typing.Iterable[str], total: typing.Optional[int]) -> None:
+        self._logger.info("Import musics from %s with thread pool", job.getSource())
+        futures: typing.Deque[concurrent.futures.Future] = collections.deque()
+        iterator, exhausted = iter(filenames), False
+        chunk, chunkTime, found, parsed = [], time.monotonic(), 0, 0
+        while not job.isCancelled():
+            if not exhausted and len(futures) <= self._importWindowSize:
+                filename = next(iterator, None)
+                exhausted = filename is None
+                if filename is not None:
+                    futures.append(self._importExecutor.submit(self._parseMusic, filename))
+                    found += 1
+                if not futures or not futures[0].done():
+                    continue
+            if not futures:
+                break
+            music = futures.popleft().result()
+            music is not None and chunk.append(music)
+            parsed += 1
+            job.setProgress(parsed, total or found)
+            if len(chunk) >= self._importChunkSize or time.monotonic() - chunkTime >= self._importChunkSeconds:
+                self._musicsChunkParsed.emit(job, chunk)
+                chunk, chunkTime = [], time.monotonic()
+        for future in futures:
+            future.cancel()
+        job.setProgress(parsed, total or found)
+        chunk and self._musicsChunkParsed.emit(job, chunk)
+        MusicUtils.getTagCacheHelper().flush()
+        self._logger.info("Import %s: %d/%d musics", "cancelled" if job.isCancelled() else "finished", parsed, found)
+        self._importJobFinished.emit(job)
+
+    def _onMusicsChunkParsed(self, job: ImportJob, musics: typing.List[Music]) -> None:
+        self._logger.info("On musics chunk parsed: %d", len(musics))
+        playlistIndex = self._findPlaylistIndex(job)
+        if playlistIndex < 0:
+            self._logger.info("Import target playlist removed, drop chunk")
+            return
+        job.addMusics(musics)
+        self._player.appendMusics(musics, playlistIndex)
+
+    def _findPlaylistIndex(self, job: ImportJob) -> int:
+        return next((i for i, x in enumerate(self._player.getPlaylists()) if x is job.getPlaylist()), -1)
+
+    def _selectImportedMusics(self, job: ImportJob) -> None:
+        playlistIndex = self._findPlaylistIndex(job)
+        if playlistIndex < 0 or len(job.getMusics()) == 0:
+            self._logger.info("Nothing imported or target playlist removed, skip selecting")
+            return
+        musicIds = {id(x) for x in job.getMusics()}
+        indexes = {i for i, x in enumerate(job.getPlaylist().musics) if id(x) in musicIds}
+        self._logger.info("Select %d imported musics", len(indexes))
+        if playlistIndex == self._player.getFrontPlaylistIndex():
+            self._player.setSelectedMusicIndexes(indexes)
+        else:
+            job.getPlaylist().selectedIndexes = indexes
+
+    def _reportImportProgress(self) -> None:
+        progress = sum(x.getProgress() for x in self._importJobs), sum(x.getTotal() for x in self._importJobs)
+        if progress == self._importProgress:
+            return
+        self._importProgress = progress
+        self.importProgressChanged.emit(*progress)
+
+    def _onImportJobFinished(self, job: ImportJob) -> None:
+        self._logger.info("On import job finished: %s", job.getSource())
+        self._reportImportProgress()
+        self._importJobs.remove(job)
+        self._selectImportedMusics(job)
+        if len(self._importJobs) > 0:
+            return
+        self._importProgressTimer.stop()
+        (progress, total), self._importProgress = self._importProgress, (-1, -1)
+        self.importFinished.emit(progress, total, job.isCancelled())
 
     def loadTestData(self):
         self._logger.info("Load test data")
         paths = Path("~/Music").expanduser().glob("**/*.mp3")
         musics = [MusicUtils.parseMusic(str(x)) for x in paths]
+        MusicUtils.getTagCacheHelper().flush()
         self._player.setFrontPlaylistIndex(self._player.insertPlaylist())
         self._player.insertMusics([x for i, x in enumerate(musics) if i % 6 in (0, 1, 2)])
         self._player.setFrontPlaylistIndex(self._player.insertPlaylist())
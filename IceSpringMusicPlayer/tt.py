@@ -38,6 +38,9 @@ FileMenu_AddFiles.zh_CN = "添加文件"
 FileMenu_AddFolder = Text()
 FileMenu_AddFolder.en_US = "Add F&older"
 FileMenu_AddFolder.zh_CN = "添加文件夹"
+FileMenu_AddWatchedFolder = Text()
+FileMenu_AddWatchedFolder.en_US = "Add &Watched Folder"
+FileMenu_AddWatchedFolder.zh_CN = "添加监视文件夹"
 FileMenu_Config = Text()
 FileMenu_Config.en_US = "Preferences"
 FileMenu_Config.zh_CN = "设置"
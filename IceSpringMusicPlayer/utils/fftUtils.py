@@ -0,0 +1,66 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 17:05
+
+import array
+import logging
+import math
+import time
+import typing
+
+from IceSpringPathLib import Path
+
+from IceSpringMusicPlayer.helpers.fftHelper import FftHelper
+from IceSpringMusicPlayer.helpers.numpyFftHelper import NumpyFftHelper
+from IceSpringMusicPlayer.helpers.pythonFftHelper import PythonFftHelper
+
+FftBackend = typing.Union[FftHelper, NumpyFftHelper, PythonFftHelper]
+
+
+class FftUtils(object):
+    _backendClasses = [FftHelper, NumpyFftHelper, PythonFftHelper]
+    _backendPath = Path("fftBackend.txt")
+    _activeBackendName = ""
+
+    @classmethod
+    def getAvailableBackendClasses(cls) -> typing.List[typing.Type[FftBackend]]:
+        return [x for x in cls._backendClasses if x.isAvailable()]
+
+    @classmethod
+    def getActiveBackendName(cls) -> str:
+        return cls._activeBackendName
+
+    @classmethod
+    def loadBackendName(cls) -> str:
+        return cls._backendPath.read_text().strip() if cls._backendPath.exists() else ""
+
+    @classmethod
+    def saveBackendName(cls, name: str) -> None:
+        cls._backendPath.write_text(name)
+
+    @classmethod
+    def createBackend(cls) -> FftBackend:
+        logger = logging.getLogger("fftUtils")
+        classes = cls.getAvailableBackendClasses()
+        preferredName = cls.loadBackendName()
+        logger.info("Available FFT backends: %s, preferred: %s", [x.__name__ for x in classes], preferredName)
+        clazz = next((x for x in classes if x.__name__ == preferredName), classes[0])
+        cls._activeBackendName = clazz.__name__
+        logger.info("Active FFT backend: %s", clazz.__name__)
+        return clazz()
+
+    @classmethod
+    def benchmarkBackends(cls, sizes: typing.List[int], rounds: int) -> typing.Dict[str, float]:
+        logger = logging.getLogger("fftUtils")
+        results = dict()
+        for clazz in cls.getAvailableBackendClasses():
+            backend = clazz()
+            elapsed = 0.0
+            for size in sizes:
+                samples = array.array('f', [math.sin(2 * math.pi * 1000 * i / 44100) for i in range(size)])
+                begin = time.perf_counter()
+                for _ in range(rounds):
+                    backend.rfftDbfs(array.array('f', samples))
+                frameElapsed = (time.perf_counter() - begin) / rounds
+                logger.info("%-16s size=%-6d %.3f ms/frame", clazz.__name__, size, frameElapsed * 1000)
+                elapsed += frameElapsed
+            results[clazz.__name__] = elapsed
+        return results
@@ -0,0 +1,125 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 14:40
+
+import array
+import mmap
+import os
+import typing
+
+from IceSpringMusicPlayer.common.seekTable import SeekTable
+
+
+class Mp3Utils(object):
+    _bitrates = {
+        (3, 3): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+        (3, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        (3, 1): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+        (2, 3): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        (2, 1): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    }
+    _sampleRates = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+    _syncSearchBytes = 2 ** 16
+
+    @classmethod
+    def parseFrameHeader(cls, data: typing.Union[bytes, mmap.mmap], offset: int) \
+            -> typing.Optional[typing.Tuple[int, int, int, int, int]]:
+        if offset + 4 > len(data) or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+            return None
+        version, layer = data[offset + 1] >> 3 & 3, data[offset + 1] >> 1 & 3
+        bitrateIndex, sampleRateIndex = data[offset + 2] >> 4, data[offset + 2] >> 2 & 3
+        if version == 1 or layer == 0 or bitrateIndex in (0, 15) or sampleRateIndex == 3:
+            return None
+        padding, channelMode = data[offset + 2] >> 1 & 1, data[offset + 3] >> 6
+        bitrate = cls._bitrates[3 if version == 3 else 2, layer][bitrateIndex]
+        sampleRate = cls._sampleRates[version][sampleRateIndex]
+        if layer == 3:
+            return (12 * bitrate * 1000 // sampleRate + padding) * 4, 384, sampleRate, bitrate, 0
+        frameSamples = 1152 if layer == 2 or version == 3 else 576
+        sideInfoSize = [[9, 17], [17, 32]][version == 3][channelMode != 3] if layer == 1 else 0
+        frameSize = frameSamples // 8 * bitrate * 1000 // sampleRate + padding
+        return frameSize, frameSamples, sampleRate, bitrate, sideInfoSize
+
+    @staticmethod
+    def calcAudioStart(data: typing.Union[bytes, mmap.mmap]) -> int:
+        if len(data) < 10 or data[:3] != b"ID3":
+            return 0
+        size = data[6] << 21 | data[7] << 14 | data[8] << 7 | data[9]
+        return 10 + size + (10 if data[5] & 0x10 else 0)
+
+    @staticmethod
+    def calcAudioEnd(data: typing.Union[bytes, mmap.mmap]) -> int:
+        return len(data) - 128 if len(data) >= 128 and data[-128:-125] == b"TAG" else len(data)
+
+    @classmethod
+    def findFirstFrame(cls, data: typing.Union[bytes, mmap.mmap]) -> int:
+        start, end = cls.calcAudioStart(data), cls.calcAudioEnd(data)
+        offset = data.find(b"\xff", start, min(end, start + cls._syncSearchBytes))
+        while offset >= 0:
+            header = cls.parseFrameHeader(data, offset)
+            if header is not None and (offset + header[0] >= end or cls.parseFrameHeader(data, offset + header[0])):
+                return offset
+            offset = data.find(b"\xff", offset + 1, min(end, start + cls._syncSearchBytes))
+        return -1
+
+    @classmethod
+    def findVbrFrameCount(cls, data: typing.Union[bytes, mmap.mmap], offset: int) -> typing.Optional[int]:
+        sideInfoSize = cls.parseFrameHeader(data, offset)[4]
+        xingOffset = offset + 4 + sideInfoSize
+        if sideInfoSize > 0 and data[xingOffset:xingOffset + 4] in (b"Xing", b"Info"):
+            hasFrames = data[xingOffset + 7] & 1
+            return int.from_bytes(data[xingOffset + 8:xingOffset + 12], "big") if hasFrames else None
+        if data[offset + 36:offset + 40] == b"VBRI":
+            return int.from_bytes(data[offset + 50:offset + 54], "big")
+        return None
+
+    @staticmethod
+    def _openMapped(filename: str) -> typing.Optional[mmap.mmap]:
+        with open(filename, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def calcDuration(cls, filename: str) -> typing.Optional[int]:
+        data = cls._openMapped(filename)
+        if data is None:
+            return None
+        with data:
+            offset = cls.findFirstFrame(data)
+            if offset < 0:
+                return None
+            _, frameSamples, sampleRate, bitrate, _ = cls.parseFrameHeader(data, offset)
+            frameCount = cls.findVbrFrameCount(data, offset)
+            if frameCount is not None:
+                return frameCount * frameSamples * 1000 // sampleRate
+            return (cls.calcAudioEnd(data) - offset) * 8 // bitrate
+
+    @classmethod
+    def scanSeekTable(cls, filename: str, intervalMillis: int) -> typing.Optional[SeekTable]:
+        data = cls._openMapped(filename)
+        if data is None:
+            return None
+        with data:
+            offset, end = cls.findFirstFrame(data), cls.calcAudioEnd(data)
+            if offset < 0:
+                return None
+            start = offset
+            sampleRate = cls.parseFrameHeader(data, offset)[2]
+            if cls.findVbrFrameCount(data, offset) is not None:
+                offset += cls.parseFrameHeader(data, offset)[0]
+            offsets = array.array("q")
+            sampleCount = 0
+            while offset < end:
+                header = cls.parseFrameHeader(data, offset)
+                if header is None:
+                    offset = data.find(b"\xff", offset + 1, end)
+                    if offset < 0:
+                        break
+                    continue
+                while sampleCount * 1000 >= len(offsets) * intervalMillis * sampleRate:
+                    offsets.append(offset)
+                sampleCount += header[1]
+                offset += header[0]
+            if not offsets:
+                return None
+            return SeekTable(intervalMillis, sampleCount * 1000 // sampleRate, start, end, offsets)
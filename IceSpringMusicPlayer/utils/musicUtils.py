@@ -1,28 +1,59 @@
 # Created by BaiJiFeiLong@gmail.com at 2022-01-08 09:05:45
 
+import os
+import threading
+import typing
 from pathlib import Path
 
 import taglib
 
 from IceSpringMusicPlayer.domains.music import Music
+from IceSpringMusicPlayer.helpers.tagCacheHelper import TagCacheHelper
+from IceSpringMusicPlayer.utils.mp3Utils import Mp3Utils
 
 
 class MusicUtils(object):
+    _tagCacheHelper: typing.Optional[TagCacheHelper] = None
+    _tagCacheLock = threading.Lock()
+    _supportedSuffixes = (".mp3", ".flac", ".ogg", ".m4a", ".wma")
+
+    @classmethod
+    def getSupportedSuffixes(cls) -> typing.Tuple[str, ...]:
+        return cls._supportedSuffixes
+
+    @classmethod
+    def getTagCacheHelper(cls) -> TagCacheHelper:
+        if cls._tagCacheHelper is None:
+            with cls._tagCacheLock:
+                if cls._tagCacheHelper is None:
+                    cls._tagCacheHelper = TagCacheHelper("caches/tags.sqlite")
+        return cls._tagCacheHelper
+
+    @classmethod
+    def parseMusic(cls, filename, stat: typing.Optional[os.stat_result] = None) -> Music:
+        stat = stat or os.stat(filename)
+        music = cls.getTagCacheHelper().find(filename, stat)
+        if music is None:
+            music = cls._doParseMusic(filename, stat)
+            cls.getTagCacheHelper().save(music, stat)
+        return music
+
     @staticmethod
-    def parseMusic(filename) -> Music:
+    def _doParseMusic(filename, stat: os.stat_result) -> Music:
         parts = [x.strip() for x in Path(filename).with_suffix("").name.rsplit("-", maxsplit=1)]
         artist, title = parts if len(parts) == 2 else ["Unknown"] + parts
         info = taglib.File(filename)
+        duration = Mp3Utils.calcDuration(filename) if Path(filename).suffix.lower() == ".mp3" else None
         music = Music(
             filename=filename,
-            filesize=Path(filename).stat().st_size,
+            filesize=stat.st_size,
             album=(info.tags.get("ALBUM") or [""])[0],
             title=(info.tags.get("TITLE") or [title])[0],
             artist=(info.tags.get("ARTIST") or [artist])[0],
             bitrate=info.bitrate,
             sampleRate=info.sampleRate,
             channels=info.channels,
-            duration=Path(filename).stat().st_size * 8 // info.bitrate,
+            duration=duration or stat.st_size * 8 // info.bitrate,
             format=Path(filename).suffix.strip(".").upper(),
         )
         info.close()
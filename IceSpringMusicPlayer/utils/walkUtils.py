@@ -0,0 +1,38 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 21:00
+
+import os
+import typing
+
+
+class WalkUtils(object):
+    @staticmethod
+    def walkFiles(root: str, suffixes: typing.Tuple[str, ...],
+            isCancelled: typing.Callable[[], bool] = lambda: False,
+            onProgress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+            onDirectory: typing.Optional[typing.Callable[[str], typing.Any]] = None) -> typing.Iterator[str]:
+        directories, directoryCount, fileCount = [root], 0, 0
+        while directories and not isCancelled():
+            directory = directories.pop()
+            directoryCount += 1
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda x: x.name)
+            except OSError:
+                continue
+            onDirectory and onDirectory(directory)
+            subdirectories = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                        continue
+                    if not entry.name.lower().endswith(suffixes) or not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                fileCount += 1
+                yield entry.path
+                if isCancelled():
+                    return
+            directories.extend(reversed(subdirectories))
+            onProgress and onProgress(directoryCount, fileCount)
@@ -34,6 +34,7 @@ class MenuToolbar(QtWidgets.QToolBar, ToolbarMixin, WidgetMixin):
         self._mainWindow = parent
         self._player = App.instance().getPlayer()
         self._playlistService = App.instance().getPlaylistService()
+        self._folderWatchService = App.instance().getFolderWatchService()
         self._configService = App.instance().getConfigService()
         self._pluginService = App.instance().getPluginService()
         self._setupView()
@@ -113,11 +114,14 @@ class MenuToolbar(QtWidgets.QToolBar, ToolbarMixin, WidgetMixin):
         self._addFilesAction.triggered.connect(self._playlistService.addMusicsFromFileDialog)
         self._addFolderAction = QtWidgets.QAction()
         self._addFolderAction.triggered.connect(self._playlistService.addMusicsFromFolderDialog)
+        self._addWatchedFolderAction = QtWidgets.QAction()
+        self._addWatchedFolderAction.triggered.connect(self._folderWatchService.addWatchedFolderFromDialog)
         self._configAction = QtWidgets.QAction()
         self._configAction.triggered.connect(lambda: ConfigDialog().exec_())
         self._fileMenu = QtWidgets.QMenu()
         self._fileMenu.addAction(self._addFilesAction)
         self._fileMenu.addAction(self._addFolderAction)
+        self._fileMenu.addAction(self._addWatchedFolderAction)
         self._fileMenu.addSeparator()
         self._fileMenu.addAction(self._configAction)
 
@@ -238,6 +242,7 @@ class MenuToolbar(QtWidgets.QToolBar, ToolbarMixin, WidgetMixin):
         self._fileMenu.setTitle(tt.FileMenu)
         self._addFilesAction.setText(tt.FileMenu_AddFiles)
         self._addFolderAction.setText(tt.FileMenu_AddFolder)
+        self._addWatchedFolderAction.setText(tt.FileMenu_AddWatchedFolder)
         self._configAction.setText(tt.FileMenu_Config)
 
         self._editMenu.setTitle(tt.EditMenu)
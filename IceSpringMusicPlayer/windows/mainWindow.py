@@ -13,7 +13,6 @@ from IceSpringMusicPlayer.app import App
 from IceSpringMusicPlayer.common.pluginWidgetMixin import PluginWidgetMixin
 from IceSpringMusicPlayer.common.toolbarMixin import ToolbarMixin
 from IceSpringMusicPlayer.domains.config import Config, Element, Toolbar
-from IceSpringMusicPlayer.domains.music import Music
 from IceSpringMusicPlayer.services.player import Player
 from IceSpringMusicPlayer.utils.timedeltaUtils import TimedeltaUtils
 from IceSpringMusicPlayer.widgets.controllerToolbar import ControllerToolbar
@@ -33,6 +32,8 @@ class MainWindow(QtWidgets.QMainWindow):
     _config: Config
     _player: Player
     _statusLabel: QtWidgets.QLabel
+    _importLabel: QtWidgets.QLabel
+    _importCancelButton: QtWidgets.QPushButton
     _playlistCombo: QtWidgets.QComboBox
     _layoutEditing: bool
     _maskWidget: typing.Optional[MaskWidget]
@@ -57,7 +58,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._initStatusBar()
         self.layoutChanged.connect(self._onLayoutChanged)
         self.layoutEditingChanged.connect(self._onLayoutEditingChanged)
-        self._playlistService.musicParsed.connect(self._onMusicParsed)
+        self._playlistService.importProgressChanged.connect(self._onImportProgressChanged)
+        self._playlistService.importFinished.connect(self._onImportFinished)
         self._player.positionChanged.connect(self._onPlayerPositionChanged)
         self._player.currentMusicIndexChanged.connect(self._onMusicIndexChanged)
         self._app.aboutToPersistConfig.connect(self._onAboutToPersistConfig)
@@ -86,10 +88,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self.restoreGeometry(QtCore.QByteArray(gg(self._config.geometry)))
         self.restoreState(QtCore.QByteArray(gg(self._config.state)))
 
-    def _onMusicParsed(self, progress: int, total: int, music: Music):
-        self._logger.info("On music parsed: %d/%d %s", progress, total, music.filename)
-        self.statusBar().showMessage("Added %d/%d %s" % (progress, total, music.filename))
-        QtCore.QCoreApplication.processEvents()
+    def _onImportProgressChanged(self, progress: int, total: int):
+        self._logger.debug("On import progress changed: %d/%d", progress, total)
+        self._importLabel.setText("Adding %d/%d" % (progress, total))
+        self._importLabel.setVisible(True)
+        self._importCancelButton.setVisible(True)
+        self._importCancelButton.setEnabled(True)
+
+    def _onImportFinished(self, progress: int, total: int, cancelled: bool):
+        self._logger.info("On import finished: %d/%d cancelled=%s", progress, total, cancelled)
+        self._importLabel.setVisible(False)
+        self._importCancelButton.setVisible(False)
+        self.statusBar().showMessage(("Import cancelled: %d/%d" if cancelled else "Added %d/%d") % (progress, total))
+
+    def _onImportCancelClicked(self):
+        self._logger.info("On import cancel clicked")
+        self._importCancelButton.setEnabled(False)
+        self._playlistService.cancelImports()
 
     def _initPalette(self):
         self.setPalette(Just.of(QtGui.QPalette()).apply(
@@ -165,12 +180,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.statusBar().setAutoFillBackground(True)
         self.statusBar().setPalette(Just.of(QtGui.QPalette()).apply(lambda x: x.setColor(QtGui.QPalette.Window,
             QtGui.QPalette().color(QtGui.QPalette.ColorRole.Window))).value())
+        importLabel = QtWidgets.QLabel("", self.statusBar())
+        importLabel.setVisible(False)
+        importCancelButton = QtWidgets.QPushButton("Cancel", self.statusBar())
+        importCancelButton.setVisible(False)
+        importCancelButton.clicked.connect(self._onImportCancelClicked)
         statusLabel = QtWidgets.QLabel("", self.statusBar())
         statusLabel.setStyleSheet("margin: 0 15px")
+        self.statusBar().addPermanentWidget(importLabel)
+        self.statusBar().addPermanentWidget(importCancelButton)
         self.statusBar().addPermanentWidget(statusLabel)
         self.statusBar().showMessage("Ready.")
         self.statusBar().installEventFilter(self)
         self._statusLabel = statusLabel
+        self._importLabel = importLabel
+        self._importCancelButton = importCancelButton
 
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
         if watched == self.statusBar() and event.type() == QtCore.QEvent.MouseButtonDblClick:
@@ -0,0 +1,20 @@
+# Created by BaiJiFeiLong@gmail.com at 2026/10/18 16:20
+
+import logging
+
+from IceSpringMusicPlayer.utils.fftUtils import FftUtils
+from IceSpringMusicPlayer.utils.logUtils import LogUtils
+
+LogUtils.initLogging()
+logging.getLogger().setLevel(logging.INFO)
+
+sampleRate = 44100
+sizes = [int(sampleRate * 0.033), 2048, 8192]
+rounds = 50
+
+logging.info("Benchmarking FFT backends...")
+results = FftUtils.benchmarkBackends(sizes, rounds)
+fastest = min(results, key=results.get)
+logging.info("Fastest FFT backend: %s", fastest)
+FftUtils.saveBackendName(fastest)
+logging.info("FFT backend saved.")